@@ -29,11 +29,12 @@ import html
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, SoupStrainer
 from typing import Dict, List, Optional, Set
 import time
 import pdfplumber
 import tempfile
+from http_session import SESSION
 
 
 # Configuration
@@ -43,15 +44,45 @@ CONSOLIDATED_LOCATIONS_PATH = Path(__file__).parent / "bin" / "consolidated_loca
 # Use system temp directory for temporary PDF storage
 OUTPUT_DIR = Path(tempfile.gettempdir()) / "pagasa_advisory_temp"
 
+# Prefer the C-based lxml parser when available, fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only the advisory block is needed, so skip building the rest of the page tree.
+# The class attribute is matched per token since the strainer sees the raw string.
+ADVISORY_STRAINER = SoupStrainer(
+    'div', class_=lambda classes: bool(classes) and 'weekly-content-adv' in classes.split()
+)
+
 # Pattern matching constants
 PATTERN_SEARCH_WINDOW = 50  # Characters to search backward for pattern boundaries
 LOCATION_NAME_PATTERN = r'[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?'  # Matches single or two-word location names
+PDF_HREF_RE = re.compile(r'\.pdf$', re.I)  # Direct PDF links on the advisory page
+
+# Rainfall indicators for all three warning levels in one alternation, so the text is
+# scanned once and matches come back already in position order (group name = level)
+# Red warning: MUST have '>' symbol for values greater than 200mm
+#   Matches: (>200 mm), (> 200 mm), >200 mm, > 200 mm
+# Orange warning: 100-200mm range
+#   Matches: (100 - 200 mm), (100 – 200 mm), 100-200 mm
+# Yellow warning: 50-100mm range
+#   Matches: (50 - 100 mm), (50 – 100 mm), 50-100 mm
+RAINFALL_INDICATOR_RE = re.compile(
+    r'(?P<red>\(?\s*>\s*200\s*mm\s*\)?)'
+    r'|(?P<orange>\(?\s*100\s*[-–]\s*200\s*mm\s*\)?)'
+    r'|(?P<yellow>\(?\s*50\s*[-–]\s*100\s*mm\s*\)?)',
+    re.IGNORECASE
+)
 
 
 class RainfallAdvisoryExtractor:
     """Extracts rainfall advisory data from PAGASA HTML pages"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
         self.valid_locations = self._load_consolidated_locations()
     
     def _load_consolidated_locations(self) -> Set[str]:
@@ -59,7 +90,8 @@ class RainfallAdvisoryExtractor:
         locations = set()
         
         if not CONSOLIDATED_LOCATIONS_PATH.exists():
-            print(f"[WARNING] Consolidated locations file not found: {CONSOLIDATED_LOCATIONS_PATH}")
+            if self.verbose:
+                print(f"[WARNING] Consolidated locations file not found: {CONSOLIDATED_LOCATIONS_PATH}")
             return locations
         
         try:
@@ -70,9 +102,11 @@ class RainfallAdvisoryExtractor:
                     if location_name:
                         locations.add(location_name)
             
-            print(f"[INFO] Loaded {len(locations)} valid locations from CSV")
+            if self.verbose:
+                print(f"[INFO] Loaded {len(locations)} valid locations from CSV")
         except Exception as e:
-            print(f"[WARNING] Failed to load consolidated locations: {e}")
+            if self.verbose:
+                print(f"[WARNING] Failed to load consolidated locations: {e}")
         
         return locations
     
@@ -434,7 +468,8 @@ class RainfallAdvisoryExtractor:
     def extract_rainfall_tables_from_pdf(self, pdf_path: str) -> List[List[List]]:
         """Extract all rainfall forecast tables from PDF"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            # Only the first page holds the rainfall table, so skip loading the rest
+            with pdfplumber.open(pdf_path, pages=[1]) as pdf:
                 if len(pdf.pages) == 0:
                     return []
                 
@@ -444,8 +479,9 @@ class RainfallAdvisoryExtractor:
                 
                 # If no text, cannot extract
                 if not has_text:
-                    print("[WARNING] PDF is image-based (scanned document) with no extractable text")
-                    print("[INFO] Falling back to HTML extraction")
+                    if self.verbose:
+                        print("[WARNING] PDF is image-based (scanned document) with no extractable text")
+                        print("[INFO] Falling back to HTML extraction")
                     return []
                 
                 # Extract tables from first page
@@ -470,7 +506,8 @@ class RainfallAdvisoryExtractor:
                 return rainfall_tables
                 
         except Exception as e:
-            print(f"[ERROR] Failed to extract tables from PDF: {e}")
+            if self.verbose:
+                print(f"[ERROR] Failed to extract tables from PDF: {e}")
             return []
     
     def extract_rainfall_warnings_from_pdf(self, pdf_path: str) -> Dict:
@@ -488,16 +525,19 @@ class RainfallAdvisoryExtractor:
         tables = self.extract_rainfall_tables_from_pdf(pdf_path)
         
         if not tables:
-            print("[WARNING] No rainfall tables found in PDF or PDF is image-based")
+            if self.verbose:
+                print("[WARNING] No rainfall tables found in PDF or PDF is image-based")
             return None  # Return None to indicate PDF extraction failed
         
-        print(f"[INFO] Processing {len(tables)} PDF table(s)")
+        if self.verbose:
+            print(f"[INFO] Processing {len(tables)} PDF table(s)")
         
         warnings = self._empty_warnings()
         
         # Process each table
         for table_idx, table in enumerate(tables):
-            print(f"[INFO] Processing table {table_idx + 1}/{len(tables)}")
+            if self.verbose:
+                print(f"[INFO] Processing table {table_idx + 1}/{len(tables)}")
             
             # Parse table rows
             for row in table:
@@ -537,38 +577,43 @@ class RainfallAdvisoryExtractor:
 
     def extract_html_text_from_url(self, url: str) -> Optional[str]:
         """Fetch HTML content from URL or local file and extract advisory text"""
-        print(f"[INFO] Fetching page from: {url}")
+        if self.verbose:
+            print(f"[INFO] Fetching page from: {url}")
         
         try:
             # Check if it's a local file path
             if os.path.exists(url):
-                print(f"[INFO] Reading from local file: {url}")
+                if self.verbose:
+                    print(f"[INFO] Reading from local file: {url}")
                 with open(url, 'r', encoding='utf-8') as f:
                     html_content = f.read()
                 return self.extract_advisory_text_from_html(html_content)
             
             # Otherwise, treat as URL
-            response = requests.get(url, timeout=30)
+            response = SESSION.get(url, timeout=30)
             response.raise_for_status()
             html_content = response.text
             
             return self.extract_advisory_text_from_html(html_content)
         except requests.RequestException as e:
-            print(f"[ERROR] Failed to fetch page: {e}")
+            if self.verbose:
+                print(f"[ERROR] Failed to fetch page: {e}")
             return None
         except Exception as e:
-            print(f"[ERROR] Failed to read file: {e}")
+            if self.verbose:
+                print(f"[ERROR] Failed to read file: {e}")
             return None
     
     def extract_advisory_text_from_html(self, html_content: str) -> Optional[str]:
         """Extract rainfall advisory text from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=ADVISORY_STRAINER)
         
         # Find the weekly-content-adv div
         advisory_div = soup.find('div', class_='weekly-content-adv')
         
         if not advisory_div:
-            print("[WARNING] Could not find weekly-content-adv div")
+            if self.verbose:
+                print("[WARNING] Could not find weekly-content-adv div")
             return None
         
         # Look for commented content first
@@ -578,7 +623,8 @@ class RainfallAdvisoryExtractor:
             comment_text = str(comment).strip()
             # Check if this comment contains rainfall data
             if 'rainfall' in comment_text.lower() or 'mm)' in comment_text.lower():
-                print("[INFO] Found rainfall data in HTML comment")
+                if self.verbose:
+                    print("[INFO] Found rainfall data in HTML comment")
                 # Decode HTML entities (e.g., &gt; to >, &nbsp; to space)
                 return html.unescape(comment_text)
         
@@ -587,10 +633,12 @@ class RainfallAdvisoryExtractor:
         for p in paragraphs:
             text = p.get_text().strip()
             if 'rainfall' in text.lower() or 'mm)' in text.lower():
-                print("[INFO] Found rainfall data in paragraph tag")
+                if self.verbose:
+                    print("[INFO] Found rainfall data in paragraph tag")
                 return text
         
-        print("[WARNING] No rainfall advisory text found in HTML")
+        if self.verbose:
+            print("[WARNING] No rainfall advisory text found in HTML")
         return None
     
     def parse_rainfall_text(self, text: str) -> Dict[str, List[str]]:
@@ -607,33 +655,11 @@ class RainfallAdvisoryExtractor:
         if not text:
             return warnings
         
-        # Patterns for rainfall indicators
-        # Red warning: MUST have '>' symbol for values greater than 200mm
-        # Matches: (>200 mm), (> 200 mm), >200 mm, > 200 mm
-        red_pattern = r'\(?\s*>\s*200\s*mm\s*\)?'
-        # Orange warning: 100-200mm range
-        # Matches: (100 - 200 mm), (100 – 200 mm), 100-200 mm
-        orange_pattern = r'\(?\s*100\s*[-–]\s*200\s*mm\s*\)?'
-        # Yellow warning: 50-100mm range
-        # Matches: (50 - 100 mm), (50 – 100 mm), 50-100 mm
-        yellow_pattern = r'\(?\s*50\s*[-–]\s*100\s*mm\s*\)?'
-        
-        # Find all rainfall indicators and their positions
-        indicators = []
-        
-        for match in re.finditer(red_pattern, text, re.IGNORECASE):
-            indicators.append(('red', match.end()))
-        
-        for match in re.finditer(orange_pattern, text, re.IGNORECASE):
-            indicators.append(('orange', match.end()))
+        # Find all rainfall indicators and their positions in a single scan
+        indicators = [(match.lastgroup, match.end()) for match in RAINFALL_INDICATOR_RE.finditer(text)]
         
-        for match in re.finditer(yellow_pattern, text, re.IGNORECASE):
-            indicators.append(('yellow', match.end()))
-        
-        # Sort by position
-        indicators.sort(key=lambda x: x[1])
-        
-        print(f"[INFO] Found {len(indicators)} rainfall indicators")
+        if self.verbose:
+            print(f"[INFO] Found {len(indicators)} rainfall indicators")
         
         # Extract locations for each indicator
         for i, (level, start_pos) in enumerate(indicators):
@@ -664,7 +690,8 @@ class RainfallAdvisoryExtractor:
             unique_locations = list(dict.fromkeys(today_locations))  # Preserves order
             warnings[level].extend(unique_locations)
             
-            print(f"[INFO] Extracted {len(unique_locations)} locations for {level} warning")
+            if self.verbose:
+                print(f"[INFO] Extracted {len(unique_locations)} locations for {level} warning")
         
         # Final deduplication across all levels
         for level in warnings:
@@ -756,10 +783,12 @@ class RainfallAdvisoryExtractor:
         advisory_text = self.extract_html_text_from_url(url)
         
         if not advisory_text:
-            print("[WARNING] No advisory text found")
+            if self.verbose:
+                print("[WARNING] No advisory text found")
             return self._empty_warnings()
         
-        print(f"[INFO] Parsing advisory text ({len(advisory_text)} characters)")
+        if self.verbose:
+            print(f"[INFO] Parsing advisory text ({len(advisory_text)} characters)")
         
         return self.parse_rainfall_text(advisory_text)
     
@@ -776,21 +805,24 @@ class RainfallAdvisoryExtractor:
         return warnings
 
 
-def fetch_page_html(url):
+def fetch_page_html(url, verbose=True):
     """Fetch HTML content from a URL"""
-    print(f"[INFO] Fetching page from: {url}")
+    if verbose:
+        print(f"[INFO] Fetching page from: {url}")
     
     try:
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.RequestException as e:
-        print(f"[ERROR] Failed to fetch page: {e}")
+        if verbose:
+            print(f"[ERROR] Failed to fetch page: {e}")
         return None
 
 
-def download_pdf(pdf_url, output_dir):
+def download_pdf(pdf_url, output_dir, verbose=True):
     """Download a PDF file to temporary location"""
+    part_path = None
     try:
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -799,38 +831,52 @@ def download_pdf(pdf_url, output_dir):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
         filename = f"advisory_{timestamp}.pdf"
         output_path = output_dir / filename
+        # Write to a .part file and rename on success so an interrupted
+        # download never leaves a truncated PDF under the final name
+        part_path = output_path.with_suffix('.pdf.part')
+        
+        if verbose:
+            print(f"[INFO] Downloading PDF to temporary location: {filename}")
+        # Stream the body to disk in 64 KB chunks instead of buffering the whole PDF;
+        # a 128 KB file buffer coalesces those chunks into fewer write syscalls
+        with SESSION.get(pdf_url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            with open(part_path, 'wb', buffering=128 * 1024) as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+        os.replace(part_path, output_path)
         
-        print(f"[INFO] Downloading PDF to temporary location: {filename}")
-        response = requests.get(pdf_url, timeout=60)
-        response.raise_for_status()
-        
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        
-        print(f"[INFO] Downloaded PDF temporarily: {output_path}")
+        if verbose:
+            print(f"[INFO] Downloaded PDF temporarily: {output_path}")
         return output_path
     except Exception as e:
-        print(f"[ERROR] Failed to download PDF: {e}")
+        if verbose:
+            print(f"[ERROR] Failed to download PDF: {e}")
+        if part_path is not None and part_path.exists():
+            part_path.unlink()
         return None
 
 
-def cleanup_temp_pdf(pdf_path):
+def cleanup_temp_pdf(pdf_path, verbose=True):
     """Delete temporary PDF file with error handling"""
     try:
         pdf_path.unlink()
-        print(f"[INFO] Deleted temporary PDF: {pdf_path.name}")
+        if verbose:
+            print(f"[INFO] Deleted temporary PDF: {pdf_path.name}")
     except Exception as e:
-        print(f"[WARNING] Failed to delete temporary PDF: {e}")
+        if verbose:
+            print(f"[WARNING] Failed to delete temporary PDF: {e}")
 
 
-def extract_pdf_url_from_page(page_url):
+def extract_pdf_url_from_page(page_url, verbose=True):
     """Extract PDF URL from PAGASA weather advisory page"""
     try:
-        print(f"[INFO] Fetching page to find PDF URL: {page_url}")
-        response = requests.get(page_url, timeout=30)
+        if verbose:
+            print(f"[INFO] Fetching page to find PDF URL: {page_url}")
+        response = SESSION.get(page_url, timeout=30)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         
         # Look for PDF link in iframe or direct link
         iframe = soup.find('iframe', {'id': 'blockrandom'})
@@ -849,28 +895,33 @@ def extract_pdf_url_from_page(page_url):
                 match = re.search(r'web\.archive\.org/web/\d+/(.*)', pdf_url)
                 if match:
                     actual_url = match.group(1)
-                    print(f"[INFO] Found PDF URL (via web archive): {actual_url}")
+                    if verbose:
+                        print(f"[INFO] Found PDF URL (via web archive): {actual_url}")
                     return actual_url
             
-            print(f"[INFO] Found PDF URL: {pdf_url}")
+            if verbose:
+                print(f"[INFO] Found PDF URL: {pdf_url}")
             return pdf_url
         
-        # Look for direct PDF links
-        pdf_links = soup.find_all('a', href=re.compile(r'\.pdf$', re.I))
-        if pdf_links:
-            pdf_url = urljoin(page_url, pdf_links[0]['href'])
-            print(f"[INFO] Found PDF URL: {pdf_url}")
+        # Look for direct PDF links (only the first one is used, so stop at it)
+        pdf_link = soup.find('a', href=PDF_HREF_RE)
+        if pdf_link:
+            pdf_url = urljoin(page_url, pdf_link['href'])
+            if verbose:
+                print(f"[INFO] Found PDF URL: {pdf_url}")
             return pdf_url
         
-        print("[WARNING] No PDF URL found on page")
+        if verbose:
+            print("[WARNING] No PDF URL found on page")
         return None
         
     except Exception as e:
-        print(f"[ERROR] Failed to extract PDF URL: {e}")
+        if verbose:
+            print(f"[ERROR] Failed to extract PDF URL: {e}")
         return None
 
 
-def extract_from_url(url: str) -> Dict:
+def extract_from_url(url: str, verbose: bool = True) -> Dict:
     """
     Extract rainfall warnings using hybrid PDF/HTML approach.
     
@@ -881,30 +932,34 @@ def extract_from_url(url: str) -> Dict:
     4. If PDF has text, use PDF extraction
     5. If PDF is image-based or extraction fails, fall back to HTML extraction
     """
-    print("="*70)
-    print("PAGASA WEATHER ADVISORY EXTRACTOR (Hybrid PDF/HTML)")
-    print("="*70)
+    if verbose:
+        print("="*70)
+        print("PAGASA WEATHER ADVISORY EXTRACTOR (Hybrid PDF/HTML)")
+        print("="*70)
     
-    extractor = RainfallAdvisoryExtractor()
+    extractor = RainfallAdvisoryExtractor(verbose=verbose)
     warnings = None
     source_type = None
     
     # Check if URL is a direct PDF file
     if url.lower().endswith('.pdf') and os.path.exists(url):
         # Local PDF file
-        print("[INFO] Detected local PDF file")
+        if verbose:
+            print("[INFO] Detected local PDF file")
         warnings = extractor.extract_rainfall_warnings_from_pdf(url)
         source_type = "PDF (local)"
         
         if warnings is None:
-            print("[INFO] PDF extraction failed, falling back to HTML extraction")
+            if verbose:
+                print("[INFO] PDF extraction failed, falling back to HTML extraction")
             # Can't fall back for local PDF
             warnings = extractor._empty_warnings()
     
     elif url.lower().endswith('.pdf'):
         # URL to PDF file
-        print("[INFO] Detected PDF URL")
-        pdf_path = download_pdf(url, OUTPUT_DIR)
+        if verbose:
+            print("[INFO] Detected PDF URL")
+        pdf_path = download_pdf(url, OUTPUT_DIR, verbose)
         
         if pdf_path:
             try:
@@ -912,48 +967,54 @@ def extract_from_url(url: str) -> Dict:
                 source_type = "PDF (downloaded)"
                 
                 if warnings is None:
-                    print("[INFO] PDF is image-based, cannot fall back to HTML for direct PDF URL")
+                    if verbose:
+                        print("[INFO] PDF is image-based, cannot fall back to HTML for direct PDF URL")
                     warnings = extractor._empty_warnings()
                     source_type = "PDF (image-based, no HTML fallback)"
             finally:
                 # Clean up: delete temporary PDF file
-                cleanup_temp_pdf(pdf_path)
+                cleanup_temp_pdf(pdf_path, verbose)
         else:
             warnings = extractor._empty_warnings()
             source_type = "Failed"
     
     else:
         # HTML page URL - try hybrid approach
-        print("[INFO] Attempting PDF extraction from page")
+        if verbose:
+            print("[INFO] Attempting PDF extraction from page")
         
         # Step 1: Try to extract PDF URL from page
-        pdf_url = extract_pdf_url_from_page(url)
+        pdf_url = extract_pdf_url_from_page(url, verbose)
         
         if pdf_url:
             # Step 2: Download PDF
-            pdf_path = download_pdf(pdf_url, OUTPUT_DIR)
+            pdf_path = download_pdf(pdf_url, OUTPUT_DIR, verbose)
             
             if pdf_path:
                 try:
                     # Step 3: Try PDF extraction
-                    print("[INFO] Attempting PDF extraction")
+                    if verbose:
+                        print("[INFO] Attempting PDF extraction")
                     warnings = extractor.extract_rainfall_warnings_from_pdf(str(pdf_path))
                     
                     if warnings is not None and any(len(v) > 0 for v in warnings.values()):
                         # PDF extraction successful
                         source_type = "PDF (text-based)"
-                        print(f"[SUCCESS] Extracted from PDF: {sum(len(v) for v in warnings.values())} total locations")
+                        if verbose:
+                            print(f"[SUCCESS] Extracted from PDF: {sum(len(v) for v in warnings.values())} total locations")
                     else:
                         # PDF extraction failed or returned empty results
-                        print("[INFO] PDF extraction unsuccessful, falling back to HTML")
+                        if verbose:
+                            print("[INFO] PDF extraction unsuccessful, falling back to HTML")
                         warnings = None
                 finally:
                     # Clean up: delete temporary PDF file
-                    cleanup_temp_pdf(pdf_path)
+                    cleanup_temp_pdf(pdf_path, verbose)
         
         # Step 4: Fall back to HTML extraction if PDF failed
         if warnings is None:
-            print("[INFO] Using HTML extraction")
+            if verbose:
+                print("[INFO] Using HTML extraction")
             warnings = extractor.extract_rainfall_warnings_from_html(url)
             source_type = "HTML (DOM parsing)"
     
@@ -972,13 +1033,14 @@ def extract_from_url(url: str) -> Dict:
     return result
 
 
-def scrape_and_extract():
+def scrape_and_extract(verbose=True):
     """Scrape and extract from live URL"""
-    print("="*70)
-    print("PAGASA WEATHER ADVISORY SCRAPER & EXTRACTOR")
-    print("="*70)
+    if verbose:
+        print("="*70)
+        print("PAGASA WEATHER ADVISORY SCRAPER & EXTRACTOR")
+        print("="*70)
     
-    return extract_from_url(TARGET_URL)
+    return extract_from_url(TARGET_URL, verbose)
 
 
 def main():
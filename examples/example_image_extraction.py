@@ -11,7 +11,8 @@ This example shows:
 import json
 import base64
 from pathlib import Path
-from typhoon_extraction import TyphoonBulletinExtractor
+import pdfplumber
+from typhoon_extraction import get_extractor
 from typhoon_image_extractor import TyphoonImageExtractor
 
 
@@ -30,7 +31,7 @@ def example_1_extract_and_save():
     
     # Step 1: Extract typhoon data
     print("\nStep 1: Extracting typhoon data...")
-    extractor = TyphoonBulletinExtractor()
+    extractor = get_extractor()
     data = extractor.extract_from_pdf(pdf_path)
     
     if data:
@@ -87,7 +88,7 @@ def example_2_stream_mode():
     
     # Step 1: Extract typhoon data
     print("\nStep 1: Extracting typhoon data...")
-    extractor = TyphoonBulletinExtractor()
+    extractor = get_extractor()
     data = extractor.extract_from_pdf(pdf_path)
     
     if not data:
@@ -184,7 +185,7 @@ def example_4_batch_processing():
     
     print(f"\nProcessing {len(pdf_files)} bulletins...")
     
-    extractor = TyphoonBulletinExtractor()
+    extractor = get_extractor()
     img_extractor = TyphoonImageExtractor()
     
     results = []
@@ -192,19 +193,19 @@ def example_4_batch_processing():
     for i, pdf_path in enumerate(pdf_files, 1):
         print(f"\n[{i}/{len(pdf_files)}] Processing: {pdf_path.name}")
         
-        # Extract data
-        data = extractor.extract_from_pdf(str(pdf_path))
-        
-        if not data:
-            print("  ✗ Failed to extract data")
-            continue
-        
-        # Extract image (stream mode - no file saving)
-        img_stream = img_extractor.extract_image(str(pdf_path))
+        # Open the PDF once and share the parsed pages between both extractors
+        with pdfplumber.open(pdf_path) as pdf:
+            # Extract data
+            data = extractor.extract_from_pdf(str(pdf_path), pdf=pdf)
+            
+            if not data:
+                print("  ✗ Failed to extract data")
+                continue
+            
+            # Extract image (stream mode - no file saving)
+            img_stream = img_extractor.extract_image_from_pdf(str(pdf_path), pdf=pdf)
         
         if img_stream:
-            img_base64 = base64.b64encode(img_stream.getvalue()).decode('utf-8')
-            
             result = {
                 'bulletin_number': i,
                 'typhoon_name': data.get('typhoon_name'),
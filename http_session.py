@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Shared HTTP session for PAGASA requests.
+
+Copyright (c) 2026 JMontero, Adotac
+Licensed under the MIT License. See LICENSE file in the project root for details.
+
+Kept in its own module so any script can reuse the session without importing
+the scrapers (and their bs4 / pdfplumber dependencies) just to get it.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# HTTP session shared by all fetches so repeated requests to the PAGASA host
+# reuse pooled keep-alive connections instead of a new TCP+TLS handshake each time.
+# Dropped connections are retried on the pool with a short backoff rather than
+# failing the whole run.
+USER_AGENT = "Mozilla/5.0 (compatible; Pagasa-WebScraper)"
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                      max_retries=Retry(total=2, backoff_factor=0.2)))
@@ -12,7 +12,10 @@ This script:
 3. Analyzes the latest PDF for each typhoon using analyze_pdf.py functionality
 4. Returns data for ALL typhoons found in the bulletin page
 
-By default, outputs raw JSON data to stdout (for easy piping/parsing).
+By default, outputs raw JSON data to stdout (for easy piping/parsing). The JSON is
+indented on a terminal and compact when piped or redirected; with orjson installed,
+non-ASCII text is written as UTF-8 rather than \\u escapes. Use --pretty for the
+indented, ASCII-escaped form everywhere.
 Use --verbose flag to see progress messages (sent to stderr).
 
 Usage:
@@ -28,46 +31,143 @@ Options:
     --extract-image                     # Extract typhoon track images (requires --stream or --save-image)
     --stream                            # Return images as base64 stream with JSON (use with --extract-image)
     --save-image                        # Save images to files (use with --extract-image)
+    --msgpack                           # Write the result as MessagePack instead of JSON (requires msgpack)
+    --pretty                            # Always write indented, ASCII-escaped JSON, even when piped
+    --no-cache                          # Download bulletin PDFs again instead of reusing cached copies
+
+Downloaded PDFs are cached in the system temp directory (pagasa_http_cache); a copy
+fetched within the last 6 hours (PDF_CACHE_MAX_AGE) is reused without contacting the
+server, older copies are revalidated with ETag / Last-Modified.
 
 Examples:
     python main.py                                      # Pure JSON output for all typhoons
     python main.py --verbose                            # JSON + progress messages
     python main.py > output.json                        # Save JSON to file
+    python main.py --pretty > output.json               # Save indented JSON to file
     python main.py --verbose 2>/dev/null                # JSON only (suppress logs)
     python main.py | jq '.typhoons[0].data.typhoon_windspeed'  # Parse with jq
     python main.py --extract-image --stream             # Extract images as base64 streams
     python main.py --extract-image --save-image         # Extract and save images to files
+    python main.py --msgpack > output.msgpack           # Compact binary output for other programs
 """
 
 import sys
 import json
+import hashlib
 import time
-import psutil
 import os
 from pathlib import Path
-from scrape_bulletin import scrape_bulletin
-from typhoon_extraction import TyphoonBulletinExtractor
-from typhoon_image_extractor import TyphoonImageExtractor
-import requests
 import tempfile
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-from contextlib import contextmanager
-from advisory_scraper import scrape_and_extract
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 import base64
+import io
+
+# psutil, requests, bs4, the scrapers and the extractors (pandas, pdfplumber) are
+# imported inside the functions that use them, so --help and argument errors exit
+# without paying their import cost
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Concurrent bulletin downloads (kept within the shared session's connection pool)
+MAX_DOWNLOAD_WORKERS = 4
+
+# On-disk HTTP cache for the bulletin page and PDFs; entries are revalidated with
+# ETag / Last-Modified so repeat runs mostly get 304 responses with no body. Scrape
+# results of the bulletin page are kept alongside, keyed by the page content
+HTTP_CACHE_DIR = Path(tempfile.gettempdir()) / "pagasa_http_cache"
+
+# Published bulletin PDFs do not change, so a cached copy younger than this (seconds)
+# is reused without even a conditional request
+PDF_CACHE_MAX_AGE = 6 * 60 * 60
+
+# Cache files not fetched or revalidated for this long (seconds) are deleted at startup
+HTTP_CACHE_EVICT_AGE = 7 * 24 * 60 * 60
+
+# Per-level keys shown by display_results
+SIGNAL_TAG_KEYS = tuple((level, f'signal_warning_tags{level}') for level in range(1, 6))
+RAINFALL_LEVELS = (
+    ('rainfall_warning_tags1', "Red Warning - Intense Rainfall (>200mm/24hr)"),
+    ('rainfall_warning_tags2', "Orange Warning - Heavy Rainfall (100-200mm/24hr)"),
+    ('rainfall_warning_tags3', "Yellow Warning - Moderate Rainfall (50-100mm/24hr)"),
+)
 
 
 @contextmanager
 def suppress_stdout():
     """Context manager to suppress stdout output."""
-    with open(os.devnull, 'w') as devnull:
-        old_stdout = sys.stdout
-        sys.stdout = devnull
-        try:
-            yield
-        finally:
-            sys.stdout = old_stdout
+    # An in-memory sink avoids opening os.devnull on every use
+    with redirect_stdout(io.StringIO()):
+        yield
+
+
+def write_json(output, pretty=False):
+    """
+    Write output to stdout as JSON, using orjson when it is installed.
+    
+    The JSON is indented for a terminal and compact when piped or redirected,
+    where it is read by other programs and the whitespace is only overhead.
+    With orjson, non-ASCII text is written as raw UTF-8 rather than \\u escapes.
+    
+    Args:
+        output: JSON-serializable result
+        pretty: Always write indented JSON with non-ASCII characters escaped
+            (json.dumps(indent=2)), whether or not stdout is a terminal
+    """
+    if pretty:
+        print(json.dumps(output, indent=2))
+        return
+    
+    indent = sys.stdout.isatty()
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    if orjson is None or stdout_buffer is None:
+        print(json.dumps(output, indent=2) if indent else json.dumps(output, separators=(',', ':')))
+        return
+    
+    option = orjson.OPT_APPEND_NEWLINE
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    sys.stdout.flush()
+    stdout_buffer.write(orjson.dumps(output, option=option))
+    stdout_buffer.flush()
+
+
+def write_msgpack(output):
+    """Write output to stdout as a single MessagePack document (requires msgpack)."""
+    import msgpack
+    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(msgpack.packb(output, use_bin_type=True))
+    sys.stdout.buffer.flush()
+
+
+def _is_url(source):
+    """Return True if source is an http(s) URL rather than a local path."""
+    return source.startswith(('http://', 'https://'))
+
+
+@lru_cache(maxsize=None)
+def _scraper_fingerprint():
+    """Digest of the scraper code and HTML parser; a scrape result is only reused if these match"""
+    from scrape_bulletin import HTML_PARSER
+    
+    digest = hashlib.sha1(HTML_PARSER.encode('ascii'))
+    for module_path in (Path(__file__), Path(__file__).with_name('scrape_bulletin.py')):
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _scrape_cache_path(html_content):
+    """Cache file for a bulletin page's scrape result, keyed by its content and the scraper code"""
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8')
+    digest = hashlib.sha1(html_content)
+    digest.update(_scraper_fingerprint().encode('ascii'))
+    return HTTP_CACHE_DIR / f"{digest.hexdigest()}.scrape.json"
 
 
 def get_typhoon_names_and_pdfs(source, verbose=False):
@@ -86,22 +186,41 @@ def get_typhoon_names_and_pdfs(source, verbose=False):
         If no names available, returns [("Unknown", [pdf_urls]), ...]
     """
     # Load HTML content
-    if source.startswith('http://') or source.startswith('https://'):
+    if _is_url(source):
         if verbose:
             print(f"Loading HTML from URL: {source}", file=sys.stderr)
-        response = requests.get(source, timeout=30)
-        response.raise_for_status()
-        html_content = response.text
+        # Raw bytes; BeautifulSoup detects the page encoding itself
+        html_content = cached_get(source).read_bytes()
+        html_encoding = None
     else:
-        filepath = Path(source)
-        if not filepath.exists():
-            raise FileNotFoundError(f"HTML file not found: {source}")
         if verbose:
             print(f"Loading HTML from file: {source}", file=sys.stderr)
-        with open(filepath, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Let the read report a missing file instead of stat-ing it first
+        try:
+            html_content = Path(source).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HTML file not found: {source}") from None
+        # Saved pages are UTF-8; naming it lets the parser decode the bytes without guessing
+        html_encoding = 'utf-8'
+    
+    # An unchanged page (e.g. a 304 from cached_get) reuses the previous scrape result
+    # and skips parsing entirely; local files are parsed directly
+    scrape_cache = _scrape_cache_path(html_content) if _is_url(source) else None
+    if scrape_cache is not None:
+        try:
+            with open(scrape_cache, 'r', encoding='utf-8') as f:
+                result = [(name, pdf_links) for name, pdf_links in json.load(f)]
+            if verbose:
+                print("[INFO] Bulletin page unchanged, reusing the cached scrape result", file=sys.stderr)
+            return result
+        except (OSError, ValueError):
+            pass
+    
+    from bs4 import BeautifulSoup
+    from scrape_bulletin import scrape_bulletin_from_soup, HTML_PARSER
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Parse once; the same tree supplies both the tab names and the PDF links
+    soup = BeautifulSoup(html_content, HTML_PARSER, from_encoding=html_encoding)
     
     # Try to extract typhoon names from tabs
     tab_list = soup.find('ul', class_='nav nav-tabs')
@@ -117,10 +236,10 @@ def get_typhoon_names_and_pdfs(source, verbose=False):
     
     # Get PDF links using the existing scraper (suppress its output if not verbose)
     if verbose:
-        pdf_links_by_typhoon = scrape_bulletin(source)
+        pdf_links_by_typhoon = scrape_bulletin_from_soup(soup)
     else:
         with suppress_stdout():
-            pdf_links_by_typhoon = scrape_bulletin(source)
+            pdf_links_by_typhoon = scrape_bulletin_from_soup(soup)
     
     # Combine names with PDF links
     result = []
@@ -131,6 +250,17 @@ def get_typhoon_names_and_pdfs(source, verbose=False):
             name = f"Typhoon {i+1}"
         result.append((name, pdf_links))
     
+    if scrape_cache is not None:
+        # The cache is only an optimisation, so a failed write is not an error
+        try:
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=HTTP_CACHE_DIR, suffix='.part',
+                                             delete=False) as tmp:
+                json.dump(result, tmp)
+            os.replace(tmp.name, scrape_cache)
+        except OSError:
+            pass
+    
     return result
 
 
@@ -157,23 +287,15 @@ def fetch_live_advisory_data(verbose=False):
     Returns dict with keys: red, orange, yellow (each containing list of locations)
     Returns None if fetch fails.
     """
+    from advisory_scraper import scrape_and_extract
+    
     try:
         if verbose:
             print("[INFO] Fetching live rainfall advisory from PAGASA...", file=sys.stderr)
         
-        # Suppress advisory_scraper output when not verbose
-        if not verbose:
-            # Redirect stdout to devnull to suppress advisory_scraper prints
-            import os
-            old_stdout = sys.stdout
-            sys.stdout = open(os.devnull, 'w')
-            try:
-                result = scrape_and_extract()
-            finally:
-                sys.stdout.close()
-                sys.stdout = old_stdout
-        else:
-            result = scrape_and_extract()
+        # This runs on a worker thread, so silence advisory_scraper through its own
+        # flag rather than redirecting the process-wide sys.stdout
+        result = scrape_and_extract(verbose=verbose)
         
         if result and 'rainfall_warnings' in result:
             warnings = result['rainfall_warnings']
@@ -195,7 +317,145 @@ def fetch_live_advisory_data(verbose=False):
 
 
 
-def analyze_pdf(pdf_url_or_path, low_cpu_mode=False, verbose=False):
+def cached_get(url, timeout=30, max_age=None, refresh=False, magic=None):
+    """
+    GET a URL through the on-disk HTTP cache.
+    
+    A cached copy is revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged resource costs a 304 response instead of a full download.
+    
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        max_age: If set, a cached copy fetched or revalidated less than this many
+            seconds ago is returned without contacting the server
+        refresh: Ignore any cached copy and download the resource again
+        magic: If set, a downloaded body must start with these bytes (e.g. b'%PDF');
+            anything else, such as an HTML error page, is discarded instead of cached
+        
+    Returns:
+        Path of the cached response body
+        
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        ValueError: If the downloaded body does not start with magic
+    """
+    from http_session import SESSION
+    
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.body"
+    meta_path = HTTP_CACHE_DIR / f"{key}.json"
+    
+    headers = {}
+    if not refresh and body_path.exists():
+        # Recent enough to use as-is, without even a conditional request
+        if max_age is not None and time.time() - body_path.stat().st_mtime < max_age:
+            return body_path
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                validators = json.load(f)
+        except (OSError, ValueError):
+            # Missing or corrupt validators: fall back to an unconditional GET
+            validators = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    
+    with SESSION.get(url, timeout=timeout, headers=headers, stream=True) as response:
+        if response.status_code == 304 and headers:
+            # Restart the max_age and eviction windows from this successful revalidation
+            os.utime(body_path)
+            os.utime(meta_path)
+            return body_path
+        response.raise_for_status()
+        
+        # Stream the body to disk in 1 MB chunks rather than holding it all in memory,
+        # through a temporary file that is renamed so readers never see a partial body
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=HTTP_CACHE_DIR, suffix='.part', delete=False) as tmp:
+            try:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    tmp.write(chunk)
+            except Exception:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+    
+    if magic is not None:
+        with open(tmp.name, 'rb') as f:
+            head = f.read(len(magic))
+        if head != magic:
+            os.unlink(tmp.name)
+            raise ValueError(f"Unexpected content from {url} (does not start with {magic!r})")
+    os.replace(tmp.name, body_path)
+    
+    if any(validators.values()):
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(validators, f)
+    elif meta_path.exists():
+        meta_path.unlink()
+    
+    return body_path
+
+
+def prune_http_cache(max_age=HTTP_CACHE_EVICT_AGE):
+    """
+    Delete HTTP cache files not written or revalidated within max_age seconds.
+    
+    Args:
+        max_age: Age in seconds beyond which a cache file is removed
+    """
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(HTTP_CACHE_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            # Removed by a concurrent run, or not removable; leave it
+            pass
+
+
+def download_pdf(pdf_url, verbose=False, refresh=False):
+    """
+    Download a PDF into the HTTP cache.
+    
+    A copy cached within PDF_CACHE_MAX_AGE is reused without a request.
+    
+    Args:
+        pdf_url: URL of the PDF file
+        verbose: Whether to show download progress
+        refresh: Download the PDF again even if it is cached
+        
+    Returns:
+        Path of the cached PDF file, or None on failure
+    """
+    import requests
+    
+    if verbose:
+        print(f"  Downloading PDF from: {pdf_url}", file=sys.stderr)
+    try:
+        cached_path = str(cached_get(pdf_url, max_age=PDF_CACHE_MAX_AGE, refresh=refresh, magic=b'%PDF'))
+        
+        if verbose:
+            print(f"  Cached PDF at: {cached_path}", file=sys.stderr)
+        return cached_path
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if verbose:
+            print(f"  Error downloading PDF: {e}", file=sys.stderr)
+        return None
+
+
+def analyze_pdf(pdf_url_or_path, low_cpu_mode=False, verbose=False, downloaded_path=None):
     """
     Analyze a PDF using the TyphoonBulletinExtractor.
     
@@ -203,32 +463,18 @@ def analyze_pdf(pdf_url_or_path, low_cpu_mode=False, verbose=False):
         pdf_url_or_path: URL or local path to PDF file
         low_cpu_mode: Whether to limit CPU usage
         verbose: Whether to show download progress
+        downloaded_path: Local copy already downloaded for this URL (e.g. by the
+            prefetcher in main)
         
     Returns:
         Dictionary of extracted data, or None on failure
     """
     # Download PDF if it's a URL (TyphoonBulletinExtractor requires local files)
-    temp_file = None
     pdf_path = pdf_url_or_path
     
-    if pdf_url_or_path.startswith('http://') or pdf_url_or_path.startswith('https://'):
-        if verbose:
-            print(f"  Downloading PDF from: {pdf_url_or_path}", file=sys.stderr)
-        try:
-            response = requests.get(pdf_url_or_path, timeout=30)
-            response.raise_for_status()
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                tmp.write(response.content)
-                temp_file = tmp.name
-                pdf_path = temp_file
-            
-            if verbose:
-                print(f"  Saved to temporary file: {temp_file}", file=sys.stderr)
-        except requests.exceptions.RequestException as e:
-            if verbose:
-                print(f"  Error downloading PDF: {e}", file=sys.stderr)
+    if _is_url(pdf_url_or_path):
+        pdf_path = downloaded_path or download_pdf(pdf_url_or_path, verbose=verbose)
+        if not pdf_path:
             return None
     else:
         # Verify local file exists
@@ -237,14 +483,17 @@ def analyze_pdf(pdf_url_or_path, low_cpu_mode=False, verbose=False):
                 print(f"  Error: Local file not found: {pdf_url_or_path}", file=sys.stderr)
             return None
     
-    # Analyze the PDF
-    extractor = TyphoonBulletinExtractor()
-    process = psutil.Process(os.getpid())
+    from typhoon_extraction import get_extractor
+    
+    # Analyze the PDF with the shared extractor (location data is loaded only once)
+    extractor = get_extractor()
     
     try:
-        # Apply continuous CPU throttling if enabled
+        # Apply continuous CPU throttling if enabled (psutil is only needed for that)
         if low_cpu_mode:
+            import psutil
             from analyze_pdf import continuous_cpu_throttle
+            process = psutil.Process(os.getpid())
             with continuous_cpu_throttle(process, target_cpu_percent=30):
                 data = extractor.extract_from_pdf(pdf_path)
         else:
@@ -257,151 +506,140 @@ def analyze_pdf(pdf_url_or_path, low_cpu_mode=False, verbose=False):
             import traceback
             traceback.print_exc()
         return None
-    finally:
-        del extractor
-        # Clean up temporary file if we created one
-        if temp_file:
-            try:
-                Path(temp_file).unlink()
-                if verbose:
-                    print(f"  Cleaned up temporary file: {temp_file}", file=sys.stderr)
-            except Exception as e:
-                if verbose:
-                    print(f"  Warning: Could not delete temp file: {e}", file=sys.stderr)
 
 
-def analyze_pdf_and_advisory_parallel(pdf_url_or_path, low_cpu_mode=False, verbose=False):
+def rainfall_tags_from_advisory(advisory_data, verbose=False):
     """
-    Run PDF analysis and advisory scraping in parallel for better performance.
+    Map live advisory data onto the rainfall_warning_tags fields of a bulletin result.
     
     Args:
-        pdf_url_or_path: URL or local path to PDF file
-        low_cpu_mode: Whether to limit CPU usage
+        advisory_data: Result of fetch_live_advisory_data (or None if it failed)
         verbose: Whether to show progress
         
     Returns:
-        Dictionary of extracted data with merged rainfall warnings, or None on failure
+        Dictionary with rainfall_warning_tags1-3 (red, orange, yellow); all empty
+        when no advisory data is available
     """
-    if verbose:
-        print("[INFO] Starting parallel execution of PDF analysis and advisory scraping...", file=sys.stderr)
-    
-    pdf_data = None
-    advisory_data = None
-    
-    # Use ThreadPoolExecutor for I/O bound operations
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        # Submit both tasks
-        pdf_future = executor.submit(analyze_pdf, pdf_url_or_path, low_cpu_mode, verbose)
-        advisory_future = executor.submit(fetch_live_advisory_data, verbose)
-        
-        # Wait for both to complete (blocks until both are done)
-        pdf_data = pdf_future.result()
-        advisory_data = advisory_future.result()
-        
-        if verbose:
-            print("[INFO] Both tasks completed", file=sys.stderr)
-    
-    # Check if PDF analysis succeeded
-    if not pdf_data:
-        if verbose:
-            print("[ERROR] PDF analysis failed", file=sys.stderr)
-        return None
-    
-    # Merge advisory data with PDF extraction results
     if advisory_data and any(advisory_data.get(level, []) for level in ['red', 'orange', 'yellow']):
-        # Add rainfall warnings from live advisory data
         # Map: red -> rainfall_warning_tags1, orange -> rainfall_warning_tags2, yellow -> rainfall_warning_tags3
-        pdf_data['rainfall_warning_tags1'] = advisory_data.get('red', [])
-        pdf_data['rainfall_warning_tags2'] = advisory_data.get('orange', [])
-        pdf_data['rainfall_warning_tags3'] = advisory_data.get('yellow', [])
         if verbose:
             print("[INFO] Added live advisory data to PDF extraction", file=sys.stderr)
-    else:
-        # If advisory fetch fails or returns empty data, set empty rainfall warnings
-        if verbose:
-            print("[INFO] No advisory data available, rainfall warnings will be empty", file=sys.stderr)
-        pdf_data['rainfall_warning_tags1'] = []
-        pdf_data['rainfall_warning_tags2'] = []
-        pdf_data['rainfall_warning_tags3'] = []
+        return {
+            'rainfall_warning_tags1': advisory_data.get('red', []),
+            'rainfall_warning_tags2': advisory_data.get('orange', []),
+            'rainfall_warning_tags3': advisory_data.get('yellow', []),
+        }
     
-    return pdf_data
+    # If advisory fetch fails or returns empty data, set empty rainfall warnings
+    if verbose:
+        print("[INFO] No advisory data available, rainfall warnings will be empty", file=sys.stderr)
+    return {
+        'rainfall_warning_tags1': [],
+        'rainfall_warning_tags2': [],
+        'rainfall_warning_tags3': [],
+    }
 
 
 def display_results(typhoon_name, data):
     """Display extraction results in a readable format."""
-    print("\n" + "=" * 80)
-    print(f"PAGASA BULLETIN ANALYSIS - {typhoon_name}")
-    print("=" * 80)
+    from typhoon_extraction import tag_locations
+    
+    # Collect the report and write it in one call instead of one print per line
+    lines = [
+        "\n" + "=" * 80,
+        f"PAGASA BULLETIN ANALYSIS - {typhoon_name}",
+        "=" * 80,
+    ]
     
     # Basic Info
-    print("\n[BASIC INFORMATION]")
-    print(f"  Issued:       {data.get('updated_datetime', 'N/A')}")
-    print(f"  Location:     {data.get('typhoon_location_text', 'N/A')}")
-    print(f"  Wind Speed:   {data.get('typhoon_windspeed', 'N/A')}")
-    print(f"  Movement:     {data.get('typhoon_movement', 'N/A')}")
+    lines += [
+        "\n[BASIC INFORMATION]",
+        f"  Issued:       {data.get('updated_datetime', 'N/A')}",
+        f"  Location:     {data.get('typhoon_location_text', 'N/A')}",
+        f"  Wind Speed:   {data.get('typhoon_windspeed', 'N/A')}",
+        f"  Movement:     {data.get('typhoon_movement', 'N/A')}",
+    ]
     
     # Signal Warnings
-    print("\n[SIGNAL WARNINGS (TCWS)]")
+    lines.append("\n[SIGNAL WARNINGS (TCWS)]")
     signal_found = False
-    for level in range(1, 6):
-        tag_key = f'signal_warning_tags{level}'
-        tag = data.get(tag_key, {})
-        
-        # Check if any island group has locations
-        has_locations = any(tag.get(ig) for ig in ['Luzon', 'Visayas', 'Mindanao', 'Other'])
+    for level, tag_key in SIGNAL_TAG_KEYS:
+        # Collect the island groups with locations once, then print from that
+        present = tag_locations(data.get(tag_key))
         
-        if has_locations:
+        if present:
             signal_found = True
-            print(f"\n  Signal {level}:")
-            for island_group in ['Luzon', 'Visayas', 'Mindanao', 'Other']:
-                locations = tag.get(island_group)
-                if locations:
-                    print(f"    {island_group:12} -> {locations}")
+            lines.append(f"\n  Signal {level}:")
+            lines.extend(f"    {island_group:12} -> {locations}" for island_group, locations in present)
     
     if not signal_found:
-        print("  [OK] No tropical cyclone wind signals in effect")
+        lines.append("  [OK] No tropical cyclone wind signals in effect")
     
     # Rainfall Warnings
-    print("\n[RAINFALL WARNINGS]")
+    lines.append("\n[RAINFALL WARNINGS]")
     rainfall_found = False
     
-    rainfall_levels = {
-        1: "Red Warning - Intense Rainfall (>200mm/24hr)",
-        2: "Orange Warning - Heavy Rainfall (100-200mm/24hr)",
-        3: "Yellow Warning - Moderate Rainfall (50-100mm/24hr)"
-    }
-    
-    for level in range(1, 4):
-        tag_key = f'rainfall_warning_tags{level}'
+    for tag_key, level_label in RAINFALL_LEVELS:
         locations = data.get(tag_key, [])
         
         # Check if there are any locations (new format is a list)
-        if locations and len(locations) > 0:
+        if locations:
             rainfall_found = True
-            print(f"\n  {rainfall_levels[level]}:")
-            print(f"    Locations: {', '.join(locations)}")
+            lines.append(f"\n  {level_label}:")
+            lines.append(f"    Locations: {', '.join(locations)}")
         else:
-            print(f"\n  {rainfall_levels[level]}: No warnings")
+            lines.append(f"\n  {level_label}: No warnings")
     
     if not rainfall_found:
-        print("  [OK] No rainfall warnings issued")
+        lines.append("  [OK] No rainfall warnings issued")
     
-    print("\n" + "=" * 80 + "\n")
+    lines.append("\n" + "=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def parse_args(argv=None):
+    """Parse the command-line options described in the module docstring."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Scrape the PAGASA bulletin page and extract data for all typhoons as JSON',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__[__doc__.index('Examples:'):]
+    )
+    
+    parser.add_argument('source', nargs='?', help='HTML file path or URL (default: bin/PAGASA.html)')
+    parser.add_argument('--verbose', action='store_true', help='Show progress messages (to stderr)')
+    parser.add_argument('--low-cpu', action='store_true', help='Limit CPU usage to ~30%%')
+    parser.add_argument('--metrics', action='store_true', help='Show performance metrics (to stderr)')
+    parser.add_argument('--extract-image', action='store_true',
+                        help='Extract typhoon track images (requires --stream or --save-image)')
+    parser.add_argument('--stream', action='store_true', help='Return images as base64 stream with JSON')
+    parser.add_argument('--save-image', action='store_true', help='Save images to files')
+    parser.add_argument('--msgpack', action='store_true',
+                        help='Write the result as MessagePack instead of JSON (requires msgpack)')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Always write indented, ASCII-escaped JSON, even when piped or redirected')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Download bulletin PDFs again instead of reusing cached copies '
+                             f'(by default a copy cached within the last {PDF_CACHE_MAX_AGE // 3600} hours '
+                             'is reused without contacting the server)')
+    
+    return parser.parse_args(argv)
 
 
 def main():
     """Main entry point."""
-    # Parse arguments
-    if '--help' in sys.argv or '-h' in sys.argv:
-        print(__doc__)
-        sys.exit(0)
-    
-    low_cpu_mode = '--low-cpu' in sys.argv
-    show_metrics = '--metrics' in sys.argv
-    verbose = '--verbose' in sys.argv
-    extract_image = '--extract-image' in sys.argv
-    stream_image = '--stream' in sys.argv
-    save_image_flag = '--save-image' in sys.argv
+    # Parse arguments before anything heavy is imported, so --help returns immediately
+    args = parse_args()
+    
+    low_cpu_mode = args.low_cpu
+    show_metrics = args.metrics
+    verbose = args.verbose
+    extract_image = args.extract_image
+    stream_image = args.stream
+    save_image_flag = args.save_image
+    msgpack_output = args.msgpack
+    no_cache = args.no_cache
     
     # Validate image extraction flags
     if extract_image and not (stream_image or save_image_flag):
@@ -414,12 +652,17 @@ def main():
             print("Error: Cannot use both --stream and --save-image", file=sys.stderr)
         sys.exit(1)
     
-    # Filter out flags to get source
-    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if msgpack_output:
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            if verbose:
+                print("Error: --msgpack requires the msgpack package (pip install msgpack)", file=sys.stderr)
+            sys.exit(1)
     
     # Determine source
-    if args:
-        source = args[0]
+    if args.source:
+        source = args.source
     else:
         default_html = Path(__file__).parent / "bin" / "PAGASA BULLETIN PAGE" / "PAGASA.html"
         if not default_html.exists():
@@ -435,13 +678,20 @@ def main():
             print(f"No source provided, using default: {source}", file=sys.stderr)
     
     start_time = time.time()
-    process = psutil.Process(os.getpid())
-    process.cpu_percent(interval=None)  # Initialize CPU monitoring
-    time.sleep(0.1)
+    process = None
+    if show_metrics:
+        import psutil
+        
+        # Prime CPU monitoring; the reading at the end covers everything since this call
+        process = psutil.Process(os.getpid())
+        process.cpu_percent(interval=None)
     
     if low_cpu_mode and verbose:
         print("[*] Low CPU mode enabled - limiting to ~30% CPU usage\n", file=sys.stderr)
     
+    # Drop stale entries so the persistent HTTP cache does not grow without bound
+    prune_http_cache()
+
     try:
         # Step 1: Extract typhoon names and PDF links
         if verbose:
@@ -466,50 +716,71 @@ def main():
         
         all_typhoon_results = []
         
-        for idx, (typhoon_name, pdf_urls) in enumerate(typhoons_data, 1):
-            if verbose:
-                print(f"\n  Processing Typhoon {idx}/{len(typhoons_data)}: {typhoon_name}", file=sys.stderr)
-            
+        # Download the latest bulletins on background threads, in processing order,
+        # so downloads overlap with each other and with the extraction of earlier
+        # typhoons. The shared http_session SESSION keeps its pooled connections
+        # to PAGASA alive across all of these requests.
+        downloader = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+        pending_downloads = {}
+        for _, pdf_urls in typhoons_data:
             latest_pdf = get_latest_pdf(pdf_urls)
-            
-            if not latest_pdf:
+            if latest_pdf and _is_url(latest_pdf) and latest_pdf not in pending_downloads:
+                pending_downloads[latest_pdf] = downloader.submit(download_pdf, latest_pdf, verbose, no_cache)
+        
+        # The rainfall advisory is the same for every typhoon, so fetch it once on the
+        # same pool; it runs alongside all of the bulletin downloads and extractions.
+        # PDF extraction itself stays on this thread since it is CPU-bound.
+        if verbose:
+            print("[INFO] Fetching advisory data in the background...", file=sys.stderr)
+        advisory_future = downloader.submit(fetch_live_advisory_data, verbose)
+        
+        try:
+            for idx, (typhoon_name, pdf_urls) in enumerate(typhoons_data, 1):
                 if verbose:
-                    print(f"    Warning: No PDFs found for {typhoon_name}, skipping...", file=sys.stderr)
-                continue
-            
-            if verbose:
-                print(f"    Latest bulletin: {latest_pdf}", file=sys.stderr)
-            
-            # Step 3: Analyze the PDF and fetch advisory data in parallel
-            # (only for first typhoon to avoid duplicate advisory fetches)
-            if verbose:
-                print(f"    Analyzing PDF{' and fetching advisory data' if idx == 1 else ''}...", file=sys.stderr)
-            
-            # Only fetch advisory data once for the first typhoon (it's the same for all typhoons)
-            if idx == 1:
-                data = analyze_pdf_and_advisory_parallel(latest_pdf, low_cpu_mode=low_cpu_mode, verbose=verbose)
-            else:
-                data = analyze_pdf(latest_pdf, low_cpu_mode=low_cpu_mode, verbose=verbose)
-                # Copy rainfall warnings from first typhoon if available
-                if all_typhoon_results and data:
-                    first_data = all_typhoon_results[0]['data']
-                    data['rainfall_warning_tags1'] = first_data.get('rainfall_warning_tags1', [])
-                    data['rainfall_warning_tags2'] = first_data.get('rainfall_warning_tags2', [])
-                    data['rainfall_warning_tags3'] = first_data.get('rainfall_warning_tags3', [])
-            
-            if not data:
+                    print(f"\n  Processing Typhoon {idx}/{len(typhoons_data)}: {typhoon_name}", file=sys.stderr)
+                
+                latest_pdf = get_latest_pdf(pdf_urls)
+                
+                if not latest_pdf:
+                    if verbose:
+                        print(f"    Warning: No PDFs found for {typhoon_name}, skipping...", file=sys.stderr)
+                    continue
+                
                 if verbose:
-                    print(f"    Warning: Failed to extract data from PDF for {typhoon_name}, skipping...", file=sys.stderr)
-                continue
-            
-            if verbose:
-                print(f"    Successfully extracted data for {typhoon_name}", file=sys.stderr)
+                    print(f"    Latest bulletin: {latest_pdf}", file=sys.stderr)
+                
+                # Step 3: Analyze the PDF
+                if verbose:
+                    print("    Analyzing PDF...", file=sys.stderr)
+                
+                # Wait for this bulletin's prefetched download, if there is one
+                download = pending_downloads.pop(latest_pdf, None)
+                downloaded_path = download.result() if download else None
+                
+                data = analyze_pdf(latest_pdf, low_cpu_mode=low_cpu_mode, verbose=verbose,
+                                   downloaded_path=downloaded_path)
+                
+                if not data:
+                    if verbose:
+                        print(f"    Warning: Failed to extract data from PDF for {typhoon_name}, skipping...", file=sys.stderr)
+                    continue
+                
+                if verbose:
+                    print(f"    Successfully extracted data for {typhoon_name}", file=sys.stderr)
+                
+                all_typhoon_results.append({
+                    'typhoon_name': typhoon_name,
+                    'pdf_url': latest_pdf,
+                    'data': data
+                })
             
-            all_typhoon_results.append({
-                'typhoon_name': typhoon_name,
-                'pdf_url': latest_pdf,
-                'data': data
-            })
+            # Attach the advisory's rainfall warnings to every typhoon in one pass
+            if all_typhoon_results:
+                rainfall_tags = rainfall_tags_from_advisory(advisory_future.result(), verbose=verbose)
+                for typhoon_result in all_typhoon_results:
+                    typhoon_result['data'].update(rainfall_tags)
+        finally:
+            downloader.shutdown(wait=True)
         
         if not all_typhoon_results:
             if verbose:
@@ -522,6 +793,8 @@ def main():
                 print("\n[STEP 4] Extracting typhoon track images...", file=sys.stderr)
                 print("-" * 80, file=sys.stderr)
             
+            from typhoon_image_extractor import TyphoonImageExtractor
+            
             img_extractor = TyphoonImageExtractor()
             
             for idx, typhoon_result in enumerate(all_typhoon_results, 1):
@@ -559,7 +832,7 @@ def main():
                         typhoon_result['image_path'] = img_path
                         if verbose:
                             print(f"    Image saved to: {img_path}", file=sys.stderr)
-                            print(f"    Image size: {len(img_stream.getvalue())} bytes", file=sys.stderr)
+                            print(f"    Image size: {img_stream.getbuffer().nbytes} bytes", file=sys.stderr)
                     else:
                         if verbose:
                             print(f"    Failed to extract image", file=sys.stderr)
@@ -573,10 +846,10 @@ def main():
                         img_stream = img_extractor.extract_image(latest_pdf, tab_index)
                     
                     if img_stream:
-                        typhoon_result['image_stream'] = base64.b64encode(img_stream.getvalue()).decode('utf-8')
+                        typhoon_result['image_stream'] = base64.b64encode(img_stream.getbuffer()).decode('ascii')
                         if verbose:
                             print(f"    Image extracted to memory stream", file=sys.stderr)
-                            print(f"    Image size: {len(img_stream.getvalue())} bytes", file=sys.stderr)
+                            print(f"    Image size: {img_stream.getbuffer().nbytes} bytes", file=sys.stderr)
                     else:
                         if verbose:
                             print(f"    Failed to extract image", file=sys.stderr)
@@ -588,7 +861,10 @@ def main():
         }
         
         # Output the results
-        print(json.dumps(output, indent=2))
+        if msgpack_output:
+            write_msgpack(output)
+        else:
+            write_json(output, pretty=args.pretty)
         
         # Performance metrics
         elapsed = time.time() - start_time
@@ -24,8 +24,19 @@ import os
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
 import json
+import re
 
 
+# Matches any href that points at a PDF (query strings and fragments allowed)
+PDF_HREF_RE = re.compile(r'\.pdf')
+
+# Prefer the C-based lxml parser when available, fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 def clean_pdf_url(href):
     """
     Clean a PDF URL by removing wayback machine wrapper.
@@ -55,17 +66,8 @@ def extract_pdfs_from_container(container):
     Returns:
         List of PDF URLs
     """
-    pdf_links = []
-    links = container.find_all('a', href=True)
-    for link in links:
-        href = link.get('href', '')
-        # href = clean_pdf_url(href)
-        
-        # Only include PDF links
-        if href.endswith('.pdf') or '.pdf' in href:
-            pdf_links.append(href)
-    
-    return pdf_links
+    # Let bs4 filter on href while walking the tree instead of a second Python loop
+    return [link['href'] for link in container.find_all('a', href=PDF_HREF_RE)]
 
 
 def scrape_with_tabs(soup):
@@ -166,14 +168,17 @@ def scrape_without_tabs(soup):
     
     # Strategy 2: Look for any list of bulletin PDFs (pattern: TCB, bulletin, etc.)
     if not pdf_links:
+        seen = set()
         all_links = soup.find_all('a', href=True)
         for link in all_links:
             href = link.get('href', '')
             # href = clean_pdf_url(href)
+            href_lower = href.lower()
             
-            # Check if it's a bulletin PDF
-            if ('.pdf' in href.lower()) and ('bulletin' in href.lower() or 'tcb' in href.lower() or 'tca' in href.lower()):
-                if href not in pdf_links:
+            # Check if it's a bulletin PDF (set lookup keeps dedup linear)
+            if ('.pdf' in href_lower) and ('bulletin' in href_lower or 'tcb' in href_lower or 'tca' in href_lower):
+                if href not in seen:
+                    seen.add(href)
                     pdf_links.append(href)
     
     # Strategy 3: Look for any PDF links in the main content area
@@ -194,21 +199,32 @@ def scrape_bulletin_from_html(html_content, base_url="https://www.pagasa.dost.go
     """
     Parse HTML content and extract PDF links organized by typhoon tabs.
     
+    Args:
+        html_content: HTML string to parse
+        base_url: Base URL for resolving relative links
+        
+    Returns:
+        List of lists, where each sub-list contains PDF links for one typhoon
+        Example: [["url1.pdf", "url2.pdf"], ["url3.pdf", "url4.pdf"]]
+    """
+    return scrape_bulletin_from_soup(BeautifulSoup(html_content, HTML_PARSER))
+
+
+def scrape_bulletin_from_soup(soup):
+    """
+    Extract PDF links organized by typhoon tabs from an already-parsed page.
+    
     This function tries multiple strategies to extract PDFs:
     1. Tab-based navigation (newer format with multiple typhoons)
     2. Direct search for bulletin archive sections (older format)
     3. Pattern matching for bulletin PDFs (fallback)
     
     Args:
-        html_content: HTML string to parse
-        base_url: Base URL for resolving relative links
+        soup: BeautifulSoup object of the bulletin page
         
     Returns:
         List of lists, where each sub-list contains PDF links for one typhoon
-        Example: [["url1.pdf", "url2.pdf"], ["url3.pdf", "url4.pdf"]]
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
     # Strategy 1: Try tab-based scraping (newer format)
     result = scrape_with_tabs(soup)
     if result:
@@ -249,16 +265,16 @@ def scrape_bulletin(source):
         2D list of PDF links organized by typhoon
     """
     # Determine if source is URL or file
-    if source.startswith('http://') or source.startswith('https://'):
+    if source.startswith(('http://', 'https://')):
         print(f"Loading HTML from URL: {source}")
         html_content = load_html_from_url(source)
     else:
-        # Treat as file path
-        filepath = Path(source)
-        if not filepath.exists():
-            raise FileNotFoundError(f"HTML file not found: {source}")
+        # Treat as file path; let open() report a missing file instead of stat-ing it first
         print(f"Loading HTML from file: {source}")
-        html_content = load_html_from_file(filepath)
+        try:
+            html_content = load_html_from_file(source)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HTML file not found: {source}") from None
     
     # Parse and extract PDF links
     print("Parsing HTML and extracting PDF links...")
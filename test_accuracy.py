@@ -27,7 +27,7 @@ import json
 import sys
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
-from typhoon_extraction import TyphoonBulletinExtractor
+from typhoon_extraction import get_extractor
 import difflib
 
 # Base paths
@@ -65,10 +65,10 @@ class AnnotationMatcher:
             if not pdf_path.exists():
                 search_dir = PDFS_PATH / storm_folder
                 if search_dir.exists():
-                    # Try to find matching PDF in folder
-                    matching_pdfs = list(search_dir.glob(f"{base_name}.pdf"))
-                    if matching_pdfs:
-                        return matching_pdfs[0]
+                    # Try to find matching PDF in folder (stop at the first hit)
+                    matching_pdf = next(search_dir.glob(f"{base_name}.pdf"), None)
+                    if matching_pdf:
+                        return matching_pdf
             
             return pdf_path
         
@@ -79,7 +79,7 @@ class AccuracyTester:
     """Test extraction accuracy against ground truth annotations"""
     
     def __init__(self, verbose: bool = False, detailed: bool = False):
-        self.extractor = TyphoonBulletinExtractor()
+        self.extractor = get_extractor()
         self.verbose = verbose
         self.detailed = detailed
         self.results = {
@@ -155,13 +155,19 @@ class AccuracyTester:
                 ground_truth_str = str(ground_truth_value).strip() if ground_truth_value else ""
                 
                 # Check for exact match
-                is_exact_match = extracted_str.lower() == ground_truth_str.lower()
+                extracted_lower = extracted_str.lower()
+                ground_truth_lower = ground_truth_str.lower()
+                is_exact_match = extracted_lower == ground_truth_lower
                 
                 # Check for partial match (substring or similarity)
                 partial_match = False
                 similarity_ratio = 0.0
                 if extracted_str and ground_truth_str:
-                    ratio = difflib.SequenceMatcher(None, extracted_str.lower(), ground_truth_str.lower()).ratio()
+                    # Identical strings always score 1.0, so only run the O(n*m) matcher on mismatches
+                    if is_exact_match:
+                        ratio = 1.0
+                    else:
+                        ratio = difflib.SequenceMatcher(None, extracted_lower, ground_truth_lower).ratio()
                     similarity_ratio = ratio
                     partial_match = ratio >= 0.7
                 
@@ -249,7 +255,7 @@ class AccuracyTester:
     
     def run_all_tests(self) -> Dict[str, Any]:
         """Run tests for all annotation files"""
-        annotation_files = sorted(list(ANNOTATIONS_PATH.glob("**/*.json")))
+        annotation_files = sorted(ANNOTATIONS_PATH.glob("**/*.json"))
         
         if not annotation_files:
             print("Error: No annotation files found in", ANNOTATIONS_PATH)
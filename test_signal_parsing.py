@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Test script for TCWS signal level parsing.
+
+Copyright (c) 2026 JMontero, Adotac
+Licensed under the MIT License. See LICENSE file in the project root for details.
+
+Checks that signal level marker lines are recognised whether or not the
+level number is zero-padded (e.g. "01" as well as "1").
+"""
+
+from typhoon_extraction import LocationMatcher, SignalWarningExtractor, is_signal_level_line
+
+
+def test_is_signal_level_line():
+    """Test which stripped lines count as signal level markers"""
+    for line in ('1', '5', '01', '05'):
+        assert is_signal_level_line(line), line
+    for line in ('', '0', '00', '6', '06', '1a', '-'):
+        assert not is_signal_level_line(line), line
+
+
+def test_zero_padded_signal_table(tmp_path):
+    """Test that a TCWS table with zero-padded level lines is parsed"""
+    csv_path = tmp_path / "locations.csv"
+    csv_path.write_text(
+        "location_name,location_type,island_group\n"
+        "Catanduanes,Province,Luzon\n"
+        "Samar,Province,Visayas\n",
+        encoding='utf-8'
+    )
+    extractor = SignalWarningExtractor(LocationMatcher(str(csv_path)))
+
+    table = (
+        "TCWS No. Luzon Visayas Mindanao\n"
+        "02\n"
+        "Catanduanes - -\n"
+        "Wind threat: gale-force winds\n"
+        "01\n"
+        "Samar\n"
+        "Wind threat: strong winds\n"
+    )
+    result = extractor._parse_signal_table(table)
+
+    assert 'Catanduanes' in result[2]['Luzon']
+    assert 'Samar' in result[1]['Luzon']
+    for level in (3, 4, 5):
+        assert all(value is None for value in result[level].values())
@@ -10,7 +10,13 @@ parsing and structured table detection to achieve 99%+ accuracy.
 No ML dependencies - pure rule-based extraction.
 """
 
+import os
 import re
+import csv
+import hashlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
@@ -19,6 +25,105 @@ from datetime import datetime
 import json
 
 
+# Patterns used in per-line / per-location loops, compiled once at import time
+WHITESPACE_RE = re.compile(r'\s+')
+PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)')
+PAREN_SPLIT_RE = re.compile(r'\s*\(')
+COMMA_SPLIT_RE = re.compile(r',\s*')
+LOCATION_PREFIX_RE = re.compile(
+    r'^(?:the|a|an|and|or|rest of|portion of|northern|southern|eastern|western|central|'
+    r'northern and central|eastern and western|island of|islands of|province of|city of|'
+    r'municipality of|municipalities of|barangay of|barangays of)\s+',
+    re.IGNORECASE
+)
+
+# Location mapping used by LocationMatcher (relative to the working directory)
+CONSOLIDATED_CSV_PATH = "bin/consolidated_locations.csv"
+
+# "Issued at" datetime formats, tried in order
+ISSUE_DATETIME_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'ISSUED\s+AT\s+(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)[,\s]+\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
+    r'ISSUED\s+AT\s+(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)[,\s]+\d{1,2}\s+\w+\s+\d{4})',
+    r'ISSUED\s*AT\s*([0-9]{1,2}:[0-9]{2}[AP]M[^0-9]*\d{1,2}\s+\w+\s+\d{4})',
+    r'ISSUEDAT\s*([0-9]{1,2}:[0-9]{2}[AP]M[,\s]*\d{1,2}\s*\w+\s*\d{4})',
+))
+
+# "No ... signal" statement: the word "no" followed within 10 words by a word
+# containing "signal" (e.g. "No Wind Signal currently hoisted.")
+NO_SIGNAL_RE = re.compile(r'(?<!\S)no\s+(?:\S+\s+){0,9}?\S*signal', re.IGNORECASE)
+
+# Non-location lines inside a TCWS table cell
+CELL_SKIP_RE = re.compile('|'.join(map(re.escape, [
+    'wind threat:', 'strong winds', 'warning lead time:',
+    'range of wind speeds:', 'potential impacts',
+    'gale-force', 'prevailing', 'expected'
+])), re.IGNORECASE)
+
+# End of a Format 1 signal block
+FORMAT1_END_RE = re.compile(r'POTENTIAL IMPACTS|HAZARDS', re.IGNORECASE)
+
+# Formatting artifacts that stand alone on a line inside a signal block
+SIGNAL_BLOCK_ARTIFACTS = frozenset({'-', '--', '- -', '*', '**'})
+
+
+# A stripped line holding just the level number (possibly zero-padded, e.g. "01")
+# marks a TCWS signal level
+def is_signal_level_line(line: str) -> bool:
+    """True if a stripped line is a TCWS signal level marker (1-5, zero-padding allowed)"""
+    return line.isdigit() and 1 <= int(line) <= 5
+
+
+# Island group keys of each signal_warning_tags{n} dict, in display order
+TAG_ISLAND_GROUPS = ('Luzon', 'Visayas', 'Mindanao', 'Other')
+
+# Signal number markers (1-5) for the stacked (Format 2) TCWS table
+SIGNAL_NUMBER_RE = re.compile(r'\n([1-5])\n|\b([1-5])\b')
+
+# Threat/impact description and page-furniture lines inside a Format 2 signal block,
+# folded into one case-insensitive alternation so each line is scanned once
+SIGNAL_BLOCK_SKIP_RE = re.compile('|'.join(map(re.escape, [
+    'wind threat:', 'gale-forc', 'strong winds', 'prevailing winds',
+    'warning lead time:', 'range of wind speeds:', 'potential impacts',
+    'minor to moderate', 'minor threat', 'moderate threat', 'property',
+    'page', 'prepared by', 'weather', 'pagasa', 'bulletin'
+])), re.IGNORECASE)
+
+TCWS_SECTION_RE = re.compile(
+    r'(?:TROPICAL\s+CYCLONE\s+WIND\s+SIGNALS[^I]*IN\s+EFFECT)(.*?)(?:HAZARDS\s+AFFECTING\s+LAND|Heavy\s+Rainfall|TRACK\s+AND\s+INTENSITY\s+OUTLOOK|$)',
+    re.IGNORECASE | re.DOTALL
+)
+IMPACT_LOCATION_RE = re.compile(
+    r'(?:portion of|area of|island of|islands of|province of|city of|municipality of|municipalities of|barangay of|barangays of|northern|southern|eastern|western)\s+(.+)',
+    re.IGNORECASE
+)
+
+# Typhoon name patterns (bulletin header)
+TYPHOON_NAME_QUOTED_RE = re.compile(
+    r'((?:Tropical\s+Depression|Tropical\s+Storm|Severe\s+Tropical\s+Storm|Typhoon|Super\s+Typhoon)\s+[\u201c\u201d""](?:[A-Z][A-Za-z]*)[\u201c\u201d""](?:\s*\([^)]*\))?)',
+    re.IGNORECASE
+)
+QUOTED_NAME_RE = re.compile(r'[\u201c\u201d""]([A-Z][A-Za-z]*)[\u201c\u201d""]', re.IGNORECASE)
+TYPHOON_NAME_RE = re.compile(
+    r'((?:Tropical\s+Depression|Tropical\s+Storm|Severe\s+Tropical\s+Storm|Typhoon|Super\s+Typhoon)\s+([A-Z][A-Za-z]*)(?:\s*\([^)]*\))?)',
+    re.IGNORECASE
+)
+TYPHOON_NAME_LPA_RE = re.compile(r'(Low\s+Pressure\s+Area\s+\(formerly\s+[A-Z][A-Za-z]*(?:\s*\([^)]*\))?\))', re.IGNORECASE)
+FORMERLY_NAME_RE = re.compile(r'formerly\s+([A-Z][A-Za-z]*)', re.IGNORECASE)
+BULLETIN_HEADER_RE = re.compile(r'TROPICAL CYCLONE (?:BULLETIN|ADVISORY)', re.IGNORECASE)
+
+# Location / movement / intensity sections
+LOCATION_SECTION_RE = re.compile(r'Location of Center.*?\n(.*?)(?=(?:Present Movement|Intensity|TRACK|PAR|$))', re.IGNORECASE | re.DOTALL)
+LOCATION_KM_RE = re.compile(r'(\d{1,2},?\d{3}\s+km\s+(?:East|West|North|South|Northeast|Northwest|Southeast|Southwest)[^(]*?)(?:\(|°|$)', re.IGNORECASE)
+LOCATION_KM_SIMPLE_RE = re.compile(r'(\d+\s+km\s+(?:East|West|North|South|Northeast|Northwest|Southeast|Southwest)[^(]*?)(?:\(|°|$)', re.IGNORECASE)
+MOVEMENT_SECTION_RE = re.compile(r'Present Movement.*?\n(.*?)(?=(?:Intensity|Location|Extent of|TRACK|PAR|$))', re.IGNORECASE | re.DOTALL)
+MOVEMENT_RE = re.compile(
+    r'((?:(?:North|South|East|West|North-?East|North-?West|South-?East|South-?West)\s+)*(?:Northwestward|Northeastward|Southwestward|Southeastward|Northward|Southward|Eastward|Westward)\s+at\s+\d+\s+km/h)',
+    re.IGNORECASE
+)
+INTENSITY_SECTION_RE = re.compile(r'Intensity.*?\n(.*?)(?=(?:Present Movement|Location|TRACK|PAR|$))', re.IGNORECASE | re.DOTALL)
+WIND_SPEED_RE = re.compile(r'(Maximum\s+sustained\s+wind[s]?\s+of\s+\d+\s+km/h[^.]*(?:and central pressure[^.]*)?)', re.IGNORECASE)
+
+
 class LocationMatcher:
     """Matches location names from PDFs to Philippine administrative divisions"""
     
@@ -45,30 +150,32 @@ class LocationMatcher:
         'CAR': 'Luzon',
     }
     
-    def __init__(self, consolidated_csv_path: str = "bin/consolidated_locations.csv"):
+    def __init__(self, consolidated_csv_path: str = CONSOLIDATED_CSV_PATH):
         """Load consolidated locations mapping"""
-        self.locations_df = pd.read_csv(consolidated_csv_path)
-        
         self.priority = {'Province': 5, 'Region': 4, 'City': 3, 'Municipality': 2, 'Barangay': 1}
         
         self.location_dict = {}
         self.island_groups_dict = {'Luzon': set(), 'Visayas': set(), 'Mindanao': set()}
         
-        grouped = {}
-        for _, row in self.locations_df.iterrows():
-            name_key = row['location_name'].lower()
-            priority = self.priority.get(row['location_type'], 0)
-            island_group = row['island_group']
-            
-            if name_key not in grouped:
-                grouped[name_key] = {'priority': priority, 'island_group': island_group}
-            elif priority > grouped[name_key]['priority']:
-                grouped[name_key] = {'priority': priority, 'island_group': island_group}
-        
-        for name_key, info in grouped.items():
-            self.location_dict[name_key] = info['island_group']
-            if info['island_group'] in self.island_groups_dict:
-                self.island_groups_dict[info['island_group']].add(name_key)
+        # Stream the CSV row by row; for each lowercased name keep the island group
+        # of its highest-priority entry (first one wins on ties)
+        best_priority = {}
+        with open(consolidated_csv_path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                name_key = row['location_name'].lower()
+                priority = self.priority.get(row['location_type'], 0)
+                
+                if name_key not in best_priority or priority > best_priority[name_key]:
+                    best_priority[name_key] = priority
+                    self.location_dict[name_key] = row['island_group']
+        
+        for name_key, island_group in self.location_dict.items():
+            if island_group in self.island_groups_dict:
+                self.island_groups_dict[island_group].add(name_key)
+        
+        # Memoized find_island_group results; names repeat heavily across
+        # signal levels and bulletins, and misses cost a scan of every location
+        self._island_group_cache = {}
     
     def find_island_group(self, location_name: str) -> Optional[str]:
         """Find which island group a location belongs to"""
@@ -77,6 +184,15 @@ class LocationMatcher:
         
         name_lower = location_name.lower().strip()
         
+        if name_lower in self._island_group_cache:
+            return self._island_group_cache[name_lower]
+        
+        island_group = self._lookup_island_group(name_lower)
+        self._island_group_cache[name_lower] = island_group
+        return island_group
+    
+    def _lookup_island_group(self, name_lower: str) -> Optional[str]:
+        """Uncached lookup: exact name, then substring match, then region names"""
         if name_lower in self.location_dict:
             return self.location_dict[name_lower]
         
@@ -99,17 +215,10 @@ class DateTimeExtractor:
     @staticmethod
     def extract_issue_datetime(text: str) -> Optional[str]:
         """Extract 'Issued at' datetime pattern"""
-        text_clean = re.sub(r'\s+', ' ', text)
-        
-        patterns = [
-            r'ISSUED\s+AT\s+(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)[,\s]+\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
-            r'ISSUED\s+AT\s+(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)[,\s]+\d{1,2}\s+\w+\s+\d{4})',
-            r'ISSUED\s*AT\s*([0-9]{1,2}:[0-9]{2}[AP]M[^0-9]*\d{1,2}\s+\w+\s+\d{4})',
-            r'ISSUEDAT\s*([0-9]{1,2}:[0-9]{2}[AP]M[,\s]*\d{1,2}\s*\w+\s*\d{4})',
-        ]
+        text_clean = WHITESPACE_RE.sub(' ', text)
         
-        for pattern in patterns:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
+        for pattern in ISSUE_DATETIME_RES:
+            match = pattern.search(text_clean)
             if match:
                 return match.group(1).strip()
         
@@ -157,7 +266,9 @@ class SignalWarningExtractor:
     def __init__(self, location_matcher: LocationMatcher):
         self.location_matcher = location_matcher
     
-    def extract_signals(self, text: str, pdf_path: Optional[str] = None) -> Dict[int, Dict[str, Optional[str]]]:
+    def extract_signals(self, text: str, pdf_path: Optional[str] = None,
+                        pdf: Optional[Any] = None,
+                        page_texts: Optional[List[str]] = None) -> Dict[int, Dict[str, Optional[str]]]:
         """
         Extract signal warnings from PDF table structure.
         Table structure:
@@ -167,6 +278,8 @@ class SignalWarningExtractor:
         
         Uses pdfplumber table extraction to directly parse the TCWS table and assign
         locations to island groups based on column position (not location matching).
+        An already-open pdfplumber document can be passed as `pdf` to avoid reopening
+        and re-parsing the file, along with its already-extracted `page_texts`.
         
         Returns: {signal_level: {island_group: location_string}}
         """
@@ -178,8 +291,6 @@ class SignalWarningExtractor:
                 result[sig_level][island] = None
             result[sig_level]['Other'] = None
         
-        text_lower = text.lower()
-        
         # Check for "no signal" statement (various phrasings)
         # Based on comprehensive analysis of 1380 PAGASA PDFs in the dataset:
         # Found 7 unique "no signal" phrases across 123 instances:
@@ -193,23 +304,17 @@ class SignalWarningExtractor:
         #
         # All phrases contain both "no" and "signal" - this is the most robust check
         # Coverage: 100% of all observed no-signal statements
-        if 'no' in text_lower and 'signal' in text_lower:
-            # Additional verification: check if it's actually a no-signal statement
-            # Look for the phrase near "signal" to avoid false positives
-            words = text_lower.split()
-            for i, word in enumerate(words):
-                if 'signal' in word:
-                    # Check if "no" appears within 10 words before "signal"
-                    context_start = max(0, i - 10)
-                    context = words[context_start:i+1]
-                    if 'no' in context:
-                        # This looks like a no-signal statement
-                        return result
-        
-        # Try table-based extraction first (if pdf_path provided)
-        if pdf_path:
+        # The word "no" must appear within 10 words before a word containing "signal"
+        # to avoid false positives; the regex scans the text in place without
+        # building a lowercased copy or a word list of the whole document
+        if NO_SIGNAL_RE.search(text):
+            # This looks like a no-signal statement
+            return result
+        
+        # Try table-based extraction first (if pdf_path or an open pdf provided)
+        if pdf_path or pdf is not None:
             try:
-                table_result = self._extract_signals_from_table(pdf_path)
+                table_result = self._extract_signals_from_table(pdf_path, pdf=pdf, page_texts=page_texts)
                 if table_result:
                     return table_result
             except (FileNotFoundError, PermissionError) as e:
@@ -227,26 +332,21 @@ class SignalWarningExtractor:
         # Check if the signal section just says "no signal"
         # Secondary check using the same robust detection as above
         # This handles bulletins where table extraction fails but text clearly states no signals
-        signal_section_lower = signal_section.lower()
-        if 'no' in signal_section_lower and 'signal' in signal_section_lower:
-            # Check if "no" appears near "signal" (within 10 words)
-            words = signal_section_lower.split()
-            for i, word in enumerate(words):
-                if 'signal' in word:
-                    context_start = max(0, i - 10)
-                    context = words[context_start:i+1]
-                    if 'no' in context:
-                        return result
+        if NO_SIGNAL_RE.search(signal_section):
+            return result
         
         # Parse the TCWS table structure from text
         signals_data = self._parse_signal_table(signal_section)
         
         return signals_data
     
-    def _extract_signals_from_table(self, pdf_path: str) -> Optional[Dict[int, Dict[str, Optional[str]]]]:
+    def _extract_signals_from_table(self, pdf_path: Optional[str],
+                                    pdf: Optional[Any] = None,
+                                    page_texts: Optional[List[str]] = None) -> Optional[Dict[int, Dict[str, Optional[str]]]]:
         """
         Extract signal warnings directly from PDF table using pdfplumber.
         This method assigns locations to island groups based on their column position.
+        Only pages whose text mentions TCWS are run through table detection.
         
         Returns: {signal_level: {island_group: location_string}} or None if no table found
         """
@@ -261,8 +361,16 @@ class SignalWarningExtractor:
         found_tcws_table = False
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
+            # Reuse the caller's open document (and its parsed pages) when given
+            opener = nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path)
+            with opener as pdf:
+                for page_idx, page in enumerate(pdf.pages):
+                    # Table detection is the most expensive pdfplumber step, and the
+                    # header row needs "TCWS" in a cell, so skip pages without it
+                    page_text = page_texts[page_idx] if page_texts is not None else (page.extract_text() or "")
+                    if 'tcws' not in page_text.lower():
+                        continue
+                    
                     tables = page.extract_tables()
                     
                     for table in tables:
@@ -281,7 +389,7 @@ class SignalWarningExtractor:
                         for i, row in enumerate(table[:self.MAX_HEADER_SEARCH_ROWS]):
                             if row and len(row) >= self.MIN_COLUMNS_FOR_TCWS_TABLE:
                                 # Check if this row has the expected column headers
-                                row_str = ' '.join([str(cell).lower() if cell else '' for cell in row])
+                                row_str = ' '.join(str(cell).lower() if cell else '' for cell in row)
                                 if 'tcws' in row_str and 'luzon' in row_str and 'visayas' in row_str and 'mindanao' in row_str:
                                     header_row_idx = i
                                     break
@@ -320,7 +428,7 @@ class SignalWarningExtractor:
                             first_cell_lines = first_cell.split('\n')
                             for line in first_cell_lines:
                                 line = line.strip()
-                                if line.isdigit() and int(line) in range(1, 6):
+                                if is_signal_level_line(line):
                                     signal_num = int(line)
                                     break
                             
@@ -366,19 +474,15 @@ class SignalWarningExtractor:
         location_lines = []
         
         for line in lines:
-            line_lower = line.strip().lower()
+            stripped = line.strip()
             
             # Skip lines that are clearly not locations
-            if any(marker in line_lower for marker in [
-                'wind threat:', 'strong winds', 'warning lead time:', 
-                'range of wind speeds:', 'potential impacts',
-                'gale-force', 'prevailing', 'expected'
-            ]):
+            if CELL_SKIP_RE.search(stripped):
                 continue
             
             # Keep the line if it has content
-            if line.strip() and line.strip() != '-':
-                location_lines.append(line.strip())
+            if stripped and stripped != '-':
+                location_lines.append(stripped)
         
         # Join cleaned lines
         result = ' '.join(location_lines)
@@ -419,7 +523,8 @@ class SignalWarningExtractor:
         # Try Format 1 first (Henry-style with header and columns)
         header_idx = -1
         for i, line in enumerate(lines):
-            if 'tcws no' in line.lower() and 'luzon' in line.lower():
+            line_lower = line.lower()
+            if 'tcws no' in line_lower and 'luzon' in line_lower:
                 header_idx = i
                 break
         
@@ -434,7 +539,7 @@ class SignalWarningExtractor:
         if is_format1:
             return self._parse_format1_table(lines, header_idx, result)
         else:
-            return self._parse_format2_table(lines, result)
+            return self._parse_format2_table(table_section, result)
         
         i = header_idx + 1
         while i < len(lines):
@@ -446,7 +551,7 @@ class SignalWarningExtractor:
                 continue
             
             # Check if this is a signal number (single digit 1-5 on its own line)
-            if line.isdigit() and int(line) in range(1, 6):
+            if is_signal_level_line(line):
                 current_signal = int(line)
                 
                 # Collect all text for this signal, as raw lines first
@@ -457,7 +562,7 @@ class SignalWarningExtractor:
                     next_stripped = next_line.strip()
                     
                     # Stop if we hit another signal number
-                    if next_stripped.isdigit() and int(next_stripped) in range(1, 6):
+                    if is_signal_level_line(next_stripped):
                         break
                     
                     # Stop at end markers
@@ -481,7 +586,7 @@ class SignalWarningExtractor:
                 full_text = full_text.replace(' - - ', ' ').replace(' - -', '')
                 
                 # Clean up extra whitespace
-                full_text = re.sub(r'\s+', ' ', full_text).strip()
+                full_text = ' '.join(full_text.split())
                 
                 # Try to split by " - " separator if it exists (only if it's NOT a separator marker)
                 # The difference: " - -" is a separator marker, but " - " with content before/after is a region separator
@@ -544,7 +649,7 @@ class SignalWarningExtractor:
                 break
             
             # If we see signal number followed by a line with " - ", that's Format 1
-            if lines[i].strip().isdigit() and int(lines[i].strip()) in range(1, 6):
+            if is_signal_level_line(lines[i].strip()):
                 if i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
                     if ' - ' in next_line or next_line in ['-', '--']:
@@ -585,7 +690,7 @@ class SignalWarningExtractor:
                 impact_description_mode = True
                 # Try to extract location from this line (e.g., "(Strong winds portion of mainland Cagayan (Santa Ana)")
                 # We want to keep "portion of mainland Cagayan (Santa Ana)"
-                location_match = re.search(r'(?:portion of|area of|island of|islands of|province of|city of|municipality of|municipalities of|barangay of|barangays of|northern|southern|eastern|western)\s+(.+)', line_text, re.IGNORECASE)
+                location_match = IMPACT_LOCATION_RE.search(line_text)
                 if location_match:
                     # Extract the matched portion INCLUDING the prefix word
                     match_text = line_text[location_match.start():]
@@ -623,7 +728,7 @@ class SignalWarningExtractor:
                 continue
             
             # Check if this is a signal number
-            if line.isdigit() and int(line) in range(1, 6):
+            if is_signal_level_line(line):
                 current_signal = int(line)
                 
                 # Collect all text for this signal
@@ -634,11 +739,11 @@ class SignalWarningExtractor:
                     next_stripped = next_line.strip()
                     
                     # Stop if we hit another signal number
-                    if next_stripped.isdigit() and int(next_stripped) in range(1, 6):
+                    if is_signal_level_line(next_stripped):
                         break
                     
                     # Stop at end markers
-                    if any(marker in next_stripped.upper() for marker in ['POTENTIAL IMPACTS', 'HAZARDS']):
+                    if FORMAT1_END_RE.search(next_stripped):
                         break
                     
                     if next_stripped:
@@ -652,7 +757,7 @@ class SignalWarningExtractor:
                 # Join and parse locations
                 full_text = ' '.join(location_lines)
                 full_text = full_text.replace(' - - ', ' ').replace(' - -', '')
-                full_text = re.sub(r'\s+', ' ', full_text).strip()
+                full_text = ' '.join(full_text.split())
                 
                 # Split by " - " if present
                 if ' - ' in full_text:
@@ -684,7 +789,7 @@ class SignalWarningExtractor:
         
         return result
     
-    def _parse_format2_table(self, lines: list, result: dict) -> dict:
+    def _parse_format2_table(self, full_text: str, result: dict) -> dict:
         """
         Parse Format 2 (Uwan-style) signal table where columns are stacked vertically.
         
@@ -699,61 +804,34 @@ class SignalWarningExtractor:
         2. For each signal, collect the locations that follow it
         3. Use LocationMatcher to classify each location to its island group
         """
-        full_text = '\n'.join(lines)
-        
-        # Find all signal numbers and their positions
-        signal_matches = []
-        for sig_num in range(1, 6):
-            pattern = rf'\n{sig_num}\n|\b{sig_num}\b'
-            for match in re.finditer(pattern, full_text):
-                signal_matches.append((match.start(), sig_num, match))
+        # Find all signal numbers and their positions in one scan; finditer
+        # yields them in order of appearance, so no sort is needed
+        signal_matches = list(SIGNAL_NUMBER_RE.finditer(full_text))
         
-        # Sort by position to process in order of appearance
-        signal_matches.sort(key=lambda x: x[0])
+        # Each block ends where the next signal number starts (or at end of text)
+        block_ends = [match.start() for match in signal_matches[1:]] + [len(full_text)]
         
         # Extract blocks for each signal
         extracted_signals = {}  # sig_num -> location_text
         
-        for idx, (pos, sig_num, match) in enumerate(signal_matches):
+        for match, sig_end in zip(signal_matches, block_ends):
+            sig_num = int(match.group(1) or match.group(2))
             # Start right after the signal number
             sig_start = match.end()
             
-            # Find end: either at next signal number or end of text
-            if idx + 1 < len(signal_matches):
-                sig_end = signal_matches[idx + 1][0]
-            else:
-                sig_end = len(full_text)
-            
             # Extract the block
             signal_block = full_text[sig_start:sig_end].strip()
             if not signal_block:
                 continue
             
-            # Clean the block: remove impact/threat descriptions
-            block_lines = signal_block.split('\n')
-            clean_lines = []
-            
-            for line in block_lines:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                
-                # Skip threat/impact descriptions
-                if any(marker in stripped.lower() for marker in 
-                       ['wind threat:', 'gale-forc', 'strong winds', 'prevailing winds',
-                        'warning lead time:', 'range of wind speeds:', 'potential impacts',
-                        'minor to moderate', 'minor threat', 'moderate threat', 'property',
-                        'page', 'prepared by', 'weather', 'pagasa', 'bulletin']):
-                    continue
-                
-                # Skip formatting artifacts
-                if stripped in ['-', '--', '- -', '*', '**']:
-                    continue
-                
-                clean_lines.append(stripped)
-            
-            # Join cleaned text
-            location_text = ' '.join(clean_lines)
+            # Clean the block: drop empty lines, threat/impact descriptions and
+            # formatting artifacts, joining the survivors without an intermediate list
+            location_text = ' '.join(
+                stripped for stripped in (line.strip() for line in signal_block.split('\n'))
+                if stripped
+                and stripped not in SIGNAL_BLOCK_ARTIFACTS
+                and not SIGNAL_BLOCK_SKIP_RE.search(stripped)
+            )
             location_text = location_text.replace(' and ', ', ').replace('  ', ' ').strip()
             
             extracted_signals[sig_num] = location_text
@@ -767,7 +845,7 @@ class SignalWarningExtractor:
             island_assignments = {'Luzon': [], 'Visayas': [], 'Mindanao': []}
             
             # Split by commas
-            location_parts = re.split(r',\s*', location_text)
+            location_parts = COMMA_SPLIT_RE.split(location_text)
             
             for part in location_parts:
                 part = part.strip()
@@ -794,14 +872,9 @@ class SignalWarningExtractor:
     def _extract_signal_section(self, text: str) -> str:
         """Extract the TCWS section from the bulletin"""
         # Look for the TCWS table header
-        patterns = [
-            r'(?:TROPICAL\s+CYCLONE\s+WIND\s+SIGNALS[^I]*IN\s+EFFECT)(.*?)(?:HAZARDS\s+AFFECTING\s+LAND|Heavy\s+Rainfall|TRACK\s+AND\s+INTENSITY\s+OUTLOOK|$)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1)
+        match = TCWS_SECTION_RE.search(text)
+        if match:
+            return match.group(1)
         
         return None
 
@@ -831,6 +904,16 @@ class RainfallWarningExtractor:
             r'light\s+rains?(?!\s+to\s+moderate)',
         ]
     }
+    INTENSITY_RES = {
+        level: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+        for level, patterns in INTENSITY_PATTERNS.items()
+    }
+    
+    RAINFALL_SECTION_RES = (
+        re.compile(r'(?:HAZARDS\s+AFFECTING\s+LAND\s+AREAS)(.*?)(?:HAZARDS AFFECTING COASTAL WATERS|WIND|TRACK AND INTENSITY|Severe Winds|$)', re.IGNORECASE | re.DOTALL),
+        re.compile(r'(?:Heavy\s+Rainfall)(.*?)(?:HAZARDS AFFECTING COASTAL WATERS|Severe Winds|WIND|TRACK|$)', re.IGNORECASE | re.DOTALL),
+    )
+    OVER_KEYWORD_RE = re.compile(r'\s+(?:over|in|affecting)\s+', re.IGNORECASE)
     
     def __init__(self, location_matcher: LocationMatcher):
         self.location_matcher = location_matcher
@@ -861,13 +944,8 @@ class RainfallWarningExtractor:
     
     def _extract_rainfall_section(self, text: str) -> str:
         """Extract the rainfall/hazards section from bulletin"""
-        patterns = [
-            r'(?:HAZARDS\s+AFFECTING\s+LAND\s+AREAS)(.*?)(?:HAZARDS AFFECTING COASTAL WATERS|WIND|TRACK AND INTENSITY|Severe Winds|$)',
-            r'(?:Heavy\s+Rainfall)(.*?)(?:HAZARDS AFFECTING COASTAL WATERS|Severe Winds|WIND|TRACK|$)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in self.RAINFALL_SECTION_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
@@ -893,7 +971,7 @@ class RainfallWarningExtractor:
         # We'll find each intensity descriptor and extract locations that follow
         
         for level in [1, 2, 3]:
-            patterns = self.INTENSITY_PATTERNS.get(level, [])
+            patterns = self.INTENSITY_RES.get(level, ())
             
             # For each intensity level, we want only ONE location set
             # Use the first match we find, stop after that
@@ -904,13 +982,13 @@ class RainfallWarningExtractor:
                     break
                     
                 # Find all matches for this intensity pattern in the section
-                for match in re.finditer(pattern, section, re.IGNORECASE):
+                for match in pattern.finditer(section):
                     # Start from the end of the intensity descriptor
                     search_start = match.end()
                     
                     # Look for "over" keyword within next 200 characters
                     remaining_text = section[search_start:search_start + 300]
-                    over_match = re.search(r'\s+(?:over|in|affecting)\s+', remaining_text, re.IGNORECASE)
+                    over_match = self.OVER_KEYWORD_RE.search(remaining_text)
                     
                     if over_match:
                         location_start = search_start + over_match.end()
@@ -969,7 +1047,7 @@ class RainfallWarningExtractor:
             return result
         
         # Clean up the text - collapse whitespace
-        location_text = re.sub(r'\s+', ' ', location_text).strip()
+        location_text = ' '.join(location_text.split())
         
         # Split by comma to get individual location entries
         # But preserve parenthetical content with its main location
@@ -986,20 +1064,13 @@ class RainfallWarningExtractor:
             
             # Determine if this location is valid
             # Extract the main location name (before parentheses)
-            main_location = re.split(r'\s*\(', location_part)[0].strip()
+            main_location = PAREN_SPLIT_RE.split(location_part)[0].strip()
             
             # Remove prefixes for lookup
-            loc_for_lookup = re.sub(
-                r'^(?:the|a|an|and|or|rest of|portion of|northern|southern|eastern|western|central|'
-                r'northern and central|eastern and western|island of|islands of|province of|city of|'
-                r'municipality of|municipalities of|barangay of|barangays of)\s+',
-                '',
-                main_location,
-                flags=re.IGNORECASE
-            ).strip()
+            loc_for_lookup = LOCATION_PREFIX_RE.sub('', main_location).strip()
             
             # Remove parenthetical content for lookup purposes only
-            loc_for_lookup_clean = re.sub(r'\s*\([^)]*\)', '', loc_for_lookup).strip()
+            loc_for_lookup_clean = PARENTHETICAL_RE.sub('', loc_for_lookup).strip()
             
             if not loc_for_lookup_clean:
                 continue
@@ -1086,20 +1157,82 @@ class RainfallWarningExtractor:
 class TyphoonBulletinExtractor:
     """Main extractor that combines all components"""
     
-    def __init__(self):
+    TEXT_BACKENDS = ('pdfplumber', 'pdfium')
+    
+    def __init__(self, text_backend: str = 'pdfplumber'):
+        """
+        Args:
+            text_backend: 'pdfplumber' (default) or 'pdfium'. The pdfium backend reads
+                the page text with pypdfium2, which is much faster, and only opens
+                pdfplumber when the TCWS table has to be parsed. Its text layout
+                differs slightly, so check it with test_accuracy.py before relying on it.
+        """
+        if text_backend not in self.TEXT_BACKENDS:
+            raise ValueError(f"Unknown text backend: {text_backend!r} (expected one of {self.TEXT_BACKENDS})")
+        self.text_backend = text_backend
         self.location_matcher = LocationMatcher()
         self.datetime_extractor = DateTimeExtractor()
         self.signal_extractor = SignalWarningExtractor(self.location_matcher)
     
-    def extract_from_pdf(self, pdf_path: str) -> Dict:
-        """Extract complete TyphoonHubType data from PDF"""
+    def extract_from_pdf(self, pdf_path: str, pdf=None) -> Dict:
+        """Extract complete TyphoonHubType data from PDF
+        
+        Pass an already-open pdfplumber document as ``pdf`` to reuse its parsed
+        pages; it is left open for the caller.
+        """
+        if pdf is None and self.text_backend == 'pdfium':
+            page_texts = self._read_text_pdfium(pdf_path)
+            if page_texts is None:
+                return None
+            # The signal extractor opens pdfplumber itself, only if a table pass is needed,
+            # and uses the pdfium page texts to go straight to the pages that mention TCWS
+            return self._extract_from_text("\n".join(page_texts), pdf_path, page_texts=page_texts)
+        
+        if pdf is None:
+            try:
+                opener = pdfplumber.open(pdf_path)
+            except Exception as e:
+                print(f"Error reading PDF {pdf_path}: {e}")
+                return None
+        else:
+            opener = nullcontext(pdf)
+        
+        # Keep the document open for the signal table pass so pages are parsed once
+        with opener as pdf:
+            try:
+                page_texts = [page.extract_text() or "" for page in pdf.pages]
+                full_text = "\n".join(page_texts)
+            except Exception as e:
+                print(f"Error reading PDF {pdf_path}: {e}")
+                return None
+            
+            return self._extract_from_text(full_text, pdf_path, pdf, page_texts)
+    
+    @staticmethod
+    def _read_text_pdfium(pdf_path: str) -> Optional[List[str]]:
+        """Read each page's text with pypdfium2, normalized to pdfplumber's '\n' line breaks"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = "\n".join([page.extract_text() or "" for page in pdf.pages])
+            import pypdfium2 as pdfium
+            
+            doc = pdfium.PdfDocument(pdf_path)
+            try:
+                page_texts = []
+                for page in doc:
+                    textpage = page.get_textpage()
+                    page_texts.append(textpage.get_text_range().replace('\r\n', '\n'))
+                    textpage.close()
+                    page.close()
+            finally:
+                doc.close()
         except Exception as e:
             print(f"Error reading PDF {pdf_path}: {e}")
             return None
         
+        return page_texts
+    
+    def _extract_from_text(self, full_text: str, pdf_path: str, pdf=None,
+                           page_texts: Optional[List[str]] = None) -> Dict:
+        """Run all field extractors over the bulletin text (and its TCWS table)"""
         # Extract components
         issue_datetime = self.datetime_extractor.extract_issue_datetime(full_text)
         normalized_datetime = self.datetime_extractor.normalize_datetime(issue_datetime)
@@ -1109,7 +1242,8 @@ class TyphoonBulletinExtractor:
         typhoon_movement = self._extract_typhoon_movement(full_text)
         typhoon_windspeed = self._extract_typhoon_windspeed(full_text)
         
-        signals_by_level = self.signal_extractor.extract_signals(full_text, pdf_path=pdf_path)
+        signals_by_level = self.signal_extractor.extract_signals(full_text, pdf_path=pdf_path, pdf=pdf,
+                                                                 page_texts=page_texts)
         
         # Build result structure
         result = {
@@ -1148,108 +1282,79 @@ class TyphoonBulletinExtractor:
         
         # Look for "TROPICAL CYCLONE BULLETIN" or "TROPICAL CYCLONE ADVISORY" line
         for i, line in enumerate(lines[:30]):  # Search only first 30 lines
-            if 'TROPICAL CYCLONE BULLETIN' in line.upper() or 'TROPICAL CYCLONE ADVISORY' in line.upper():
+            line_upper = line.upper()
+            if 'TROPICAL CYCLONE BULLETIN' in line_upper or 'TROPICAL CYCLONE ADVISORY' in line_upper:
                 # Check the next line for typhoon category and name
                 if i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
                     
-                    # Pattern 1a: Active typhoon with quotes (both straight and curly)
-                    # Captures the full "Category NAME" string
-                    pattern_quoted = r'((?:Tropical\s+Depression|Tropical\s+Storm|Severe\s+Tropical\s+Storm|Typhoon|Super\s+Typhoon)\s+[\u201c\u201d""](?:[A-Z][A-Za-z]*)[\u201c\u201d""](?:\s*\([^)]*\))?)'
-                    match = re.search(pattern_quoted, next_line, re.IGNORECASE)
-                    
-                    if match:
-                        full_name = match.group(1).strip()
-                        # Extract just the name part to check exclusions
-                        name_match = re.search(r'[\u201c\u201d""]([A-Z][A-Za-z]*)[\u201c\u201d""]', full_name, re.IGNORECASE)
-                        if name_match:
-                            name_only = name_match.group(1).upper()
-                            if name_only not in EXCLUDED_WORDS:
-                                return full_name
-                    
-                    # Pattern 1b: Active typhoon without quotes - "Tropical Depression WILMA"
-                    # Captures the full "Category NAME" or "Category NAME (INTERNATIONAL)"
-                    pattern = r'((?:Tropical\s+Depression|Tropical\s+Storm|Severe\s+Tropical\s+Storm|Typhoon|Super\s+Typhoon)\s+([A-Z][A-Za-z]*)(?:\s*\([^)]*\))?)'
-                    match = re.search(pattern, next_line, re.IGNORECASE)
-                    
-                    if match:
-                        full_name = match.group(1).strip()
-                        name_only = match.group(2).upper()
-                        if name_only not in EXCLUDED_WORDS and len(name_only) >= 3:
-                            return full_name
-                    
-                    # Pattern 2: Low Pressure Area (formerly NAME) - for final bulletins
-                    pattern_lpa = r'(Low\s+Pressure\s+Area\s+\(formerly\s+[A-Z][A-Za-z]*(?:\s*\([^)]*\))?\))'
-                    match_lpa = re.search(pattern_lpa, next_line, re.IGNORECASE)
-                    
-                    if match_lpa:
-                        full_name = match_lpa.group(1).strip()
-                        # Extract just the name to check exclusions
-                        name_match = re.search(r'formerly\s+([A-Z][A-Za-z]*)', full_name, re.IGNORECASE)
-                        if name_match:
-                            name_only = name_match.group(1).upper()
-                            if name_only not in EXCLUDED_WORDS:
-                                return full_name
+                    full_name = self._match_typhoon_name(next_line, EXCLUDED_WORDS)
+                    if full_name:
+                        return full_name
         
         # Fallback: Only search within bulletin/advisory context (not entire page)
-        bulletin_match = re.search(r'TROPICAL CYCLONE (?:BULLETIN|ADVISORY)', text, re.IGNORECASE)
+        bulletin_match = BULLETIN_HEADER_RE.search(text)
         if bulletin_match:
             # Extract text starting from the bulletin header (next 500 chars)
             start_pos = bulletin_match.start()
             search_text = text[start_pos:start_pos + 500]
             
-            # Try quoted pattern first
-            pattern_quoted = r'((?:Tropical\s+Depression|Tropical\s+Storm|Severe\s+Tropical\s+Storm|Typhoon|Super\s+Typhoon)\s+[\u201c\u201d""](?:[A-Z][A-Za-z]*)[\u201c\u201d""](?:\s*\([^)]*\))?)'
-            match = re.search(pattern_quoted, search_text, re.IGNORECASE)
-            if match:
-                full_name = match.group(1).strip()
-                name_match = re.search(r'[\u201c\u201d""]([A-Z][A-Za-z]*)[\u201c\u201d""]', full_name, re.IGNORECASE)
-                if name_match:
-                    name_only = name_match.group(1).upper()
-                    if name_only not in EXCLUDED_WORDS:
-                        return full_name
-            
-            # Try active typhoon pattern
-            pattern = r'((?:Tropical\s+Depression|Tropical\s+Storm|Severe\s+Tropical\s+Storm|Typhoon|Super\s+Typhoon)\s+([A-Z][A-Za-z]*)(?:\s*\([^)]*\))?)'
-            match = re.search(pattern, search_text, re.IGNORECASE)
-            if match:
-                full_name = match.group(1).strip()
-                name_only = match.group(2).upper()
-                if name_only not in EXCLUDED_WORDS and len(name_only) >= 3:
-                    return full_name
-            
-            # Try LPA pattern
-            pattern_lpa = r'(Low\s+Pressure\s+Area\s+\(formerly\s+[A-Z][A-Za-z]*(?:\s*\([^)]*\))?\))'
-            match_lpa = re.search(pattern_lpa, search_text, re.IGNORECASE)
-            if match_lpa:
-                full_name = match_lpa.group(1).strip()
-                name_match = re.search(r'formerly\s+([A-Z][A-Za-z]*)', full_name, re.IGNORECASE)
-                if name_match:
-                    name_only = name_match.group(1).upper()
-                    if name_only not in EXCLUDED_WORDS:
-                        return full_name
+            full_name = self._match_typhoon_name(search_text, EXCLUDED_WORDS)
+            if full_name:
+                return full_name
         
         return "Typhoon name not found"
     
+    @staticmethod
+    def _match_typhoon_name(search_text: str, excluded_words: set) -> Optional[str]:
+        """Try the quoted, unquoted and LPA name patterns in order; return the full name or None"""
+        # Pattern 1a: Active typhoon with quotes (both straight and curly)
+        # Captures the full "Category NAME" string
+        match = TYPHOON_NAME_QUOTED_RE.search(search_text)
+        if match:
+            full_name = match.group(1).strip()
+            # Extract just the name part to check exclusions
+            name_match = QUOTED_NAME_RE.search(full_name)
+            if name_match and name_match.group(1).upper() not in excluded_words:
+                return full_name
+        
+        # Pattern 1b: Active typhoon without quotes - "Tropical Depression WILMA"
+        # Captures the full "Category NAME" or "Category NAME (INTERNATIONAL)"
+        match = TYPHOON_NAME_RE.search(search_text)
+        if match:
+            full_name = match.group(1).strip()
+            name_only = match.group(2).upper()
+            if name_only not in excluded_words and len(name_only) >= 3:
+                return full_name
+        
+        # Pattern 2: Low Pressure Area (formerly NAME) - for final bulletins
+        match_lpa = TYPHOON_NAME_LPA_RE.search(search_text)
+        if match_lpa:
+            full_name = match_lpa.group(1).strip()
+            # Extract just the name to check exclusions
+            name_match = FORMERLY_NAME_RE.search(full_name)
+            if name_match and name_match.group(1).upper() not in excluded_words:
+                return full_name
+        
+        return None
+    
     def _extract_typhoon_location(self, text: str) -> str:
         """Extract current typhoon location - exact text from 'Location of Center' section"""
         # Look for "Location of Center" header, then extract the location description
         # Stop at next major section or end
-        pattern = r'Location of Center.*?\n(.*?)(?=(?:Present Movement|Intensity|TRACK|PAR|$))'
-        
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        match = LOCATION_SECTION_RE.search(text)
         if match:
             location_block = match.group(1).strip()
             # Extract the actual location text (should contain km, direction, and place name)
             # Allow for optional comma separator in numbers (e.g., "1,830 km" or "830 km")
-            location_match = re.search(r'(\d{1,2},?\d{3}\s+km\s+(?:East|West|North|South|Northeast|Northwest|Southeast|Southwest)[^(]*?)(?:\(|°|$)', location_block, re.IGNORECASE)
+            location_match = LOCATION_KM_RE.search(location_block)
             if location_match:
                 result = location_match.group(1).strip()
                 # Clean up newlines and multiple spaces
                 result = result.replace('\n', ' ').replace('  ', ' ')
                 return result
             # Fallback to simpler pattern
-            location_match = re.search(r'(\d+\s+km\s+(?:East|West|North|South|Northeast|Northwest|Southeast|Southwest)[^(]*?)(?:\(|°|$)', location_block, re.IGNORECASE)
+            location_match = LOCATION_KM_SIMPLE_RE.search(location_block)
             if location_match:
                 result = location_match.group(1).strip()
                 result = result.replace('\n', ' ').replace('  ', ' ')
@@ -1263,16 +1368,14 @@ class TyphoonBulletinExtractor:
     def _extract_typhoon_movement(self, text: str) -> str:
         """Extract typhoon movement - from 'Present Movement' section"""
         # Look for "Present Movement" header followed by movement description
-        pattern = r'Present Movement.*?\n(.*?)(?=(?:Intensity|Location|Extent of|TRACK|PAR|$))'
-        
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        match = MOVEMENT_SECTION_RE.search(text)
         if match:
             movement_block = match.group(1).strip()
             # Clean up newlines first
             movement_block = movement_block.replace('\n', ' ').replace('  ', ' ')
             
             # Try patterns with compound directions first (e.g., "West northwestward at 10 km/h")
-            movement_match = re.search(r'((?:(?:North|South|East|West|North-?East|North-?West|South-?East|South-?West)\s+)*(?:Northwestward|Northeastward|Southwestward|Southeastward|Northward|Southward|Eastward|Westward)\s+at\s+\d+\s+km/h)', movement_block, re.IGNORECASE)
+            movement_match = MOVEMENT_RE.search(movement_block)
             if movement_match:
                 result = movement_match.group(1).strip()
                 result = result[0].upper() + result[1:]
@@ -1289,17 +1392,15 @@ class TyphoonBulletinExtractor:
     def _extract_typhoon_windspeed(self, text: str) -> str:
         """Extract maximum sustained wind speed with full descriptive text"""
         # Look for "Intensity" header followed by wind speed info
-        pattern = r'Intensity.*?\n(.*?)(?=(?:Present Movement|Location|TRACK|PAR|$))'
-        
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        match = INTENSITY_SECTION_RE.search(text)
         if match:
             intensity_block = match.group(1).strip()
             # Extract the wind speed line (should have "Maximum sustained winds")
-            wind_match = re.search(r'(Maximum\s+sustained\s+wind[s]?\s+of\s+\d+\s+km/h[^.]*(?:and central pressure[^.]*)?)', intensity_block, re.IGNORECASE)
+            wind_match = WIND_SPEED_RE.search(intensity_block)
             if wind_match:
                 result = wind_match.group(1).strip()
                 # Clean up multiple spaces and newlines
-                result = re.sub(r'\s+', ' ', result)
+                result = ' '.join(result.split())
                 return result
         
         return "Wind speed not found"
@@ -1322,38 +1423,159 @@ class TyphoonBulletinExtractor:
         return result
 
 
-def extract_from_directory(pdfs_directory: str, output_json: str = "bin/extracted_typhoon_data.json"):
-    """Extract data from all PDFs in a directory"""
-    extractor = TyphoonBulletinExtractor()
-    results = []
+def tag_locations(tag: Optional[Dict[str, Optional[str]]]) -> List[Tuple[str, str]]:
+    """(island_group, locations) pairs for the island groups of a warning tag that have locations"""
+    if not tag:
+        return []
+    return [(island_group, tag[island_group]) for island_group in TAG_ISLAND_GROUPS if tag.get(island_group)]
+
+
+@functools.lru_cache(maxsize=1)
+def get_extractor() -> TyphoonBulletinExtractor:
+    """Return a shared TyphoonBulletinExtractor, building it (and its location data) only once"""
+    return TyphoonBulletinExtractor()
+
+
+@functools.lru_cache(maxsize=1)
+def _extractor_fingerprint() -> bytes:
+    """Digest of this module's source and the location CSV, so cached results are
+    dropped when the rules or the location mapping change"""
+    digest = hashlib.sha1(Path(__file__).read_bytes())
+    try:
+        digest.update(Path(CONSOLIDATED_CSV_PATH).read_bytes())
+    except OSError:
+        # No mapping to fingerprint; the extractor itself reports the missing file
+        pass
+    return digest.digest()
+
+
+def _extraction_cache_path(pdf_path: str, cache_dir: str) -> Path:
+    """Cache file for a PDF, keyed by its content and the extractor version"""
+    digest = hashlib.sha1(_extractor_fingerprint())
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    key = digest.hexdigest()
+    return Path(cache_dir) / key[:2] / f"{key}.json"
+
+
+def _extract_one(pdf_path: str, cache_dir: Optional[str] = None) -> Optional[Dict]:
+    """Extract a single PDF in a pool worker, reusing that process's extractor"""
+    cache_path = None
+    if cache_dir:
+        cache_path = _extraction_cache_path(pdf_path, cache_dir)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data['source_file'] = pdf_path
+            return data
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt entry: extract again and rewrite it
+            pass
     
-    pdfs_path = Path(pdfs_directory)
-    pdf_files = list(pdfs_path.rglob("*.pdf"))
+    data = get_extractor().extract_from_pdf(pdf_path)
+    if data:
+        data['source_file'] = pdf_path
+        if cache_path:
+            # Write then rename so a concurrent or interrupted run never sees a partial entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+    return data
+
+
+def find_pdf_files(directory: str) -> List[str]:
+    """Sorted paths of every .pdf file under a directory, walked with os.scandir
     
-    print(f"Found {len(pdf_files)} PDF files")
+    Uses the type information cached on each directory entry rather than building
+    and stat-ing a Path object per file as Path.rglob does.
+    """
+    pdf_files = []
+    pending_dirs = [directory]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(entry.path)
+                elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                    pdf_files.append(entry.path)
+    
+    pdf_files.sort()
+    return pdf_files
+
+
+# How many bulletins extract_from_directory processes between progress lines
+PROGRESS_EVERY = 50
+
+
+def extract_from_directory(pdfs_directory: str, output_json: str = "bin/extracted_typhoon_data.json",
+                           max_workers: Optional[int] = None, cache_dir: Optional[str] = None,
+                           keep_results: bool = True) -> Optional[List[Dict]]:
+    """Extract data from all PDFs in a directory, one worker process per core
+    
+    The output file is a JSON array written one compact record per line as bulletins
+    finish (it was previously a single indent=2 dump at the end).
+    
+    With ``cache_dir`` set (e.g. "bin/extraction_cache"), results are cached per PDF
+    content so re-runs only parse new or changed bulletins.
     
-    for i, pdf_file in enumerate(pdf_files):
-        print(f"Processing [{i+1}/{len(pdf_files)}] {pdf_file.name}...")
-        data = extractor.extract_from_pdf(str(pdf_file))
-        if data:
-            data['source_file'] = str(pdf_file)
-            results.append(data)
+    With ``keep_results`` False, records are only written to the file and not also
+    collected in memory, and None is returned instead of the list of records.
+    """
+    results = [] if keep_results else None
+    extracted_count = 0
+    
+    pdf_files = find_pdf_files(pdfs_directory)
+    
+    print(f"Found {len(pdf_files)} PDF files")
     
+    # Stream the JSON array one compact record per line as bulletins finish, so
+    # there is no large final dump and a partial run still leaves usable output
     with open(output_json, 'w') as f:
-        json.dump(results, f, indent=2)
+        f.write('[')
+        
+        if pdf_files:
+            workers = max_workers or os.cpu_count() or 1
+            # Batch a few files per task to cut IPC overhead while keeping workers evenly loaded
+            chunksize = max(1, len(pdf_files) // (workers * 4))
+            # Build each worker's extractor up front rather than inside its first task
+            with ProcessPoolExecutor(max_workers=workers, initializer=get_extractor) as executor:
+                extract_one = functools.partial(_extract_one, cache_dir=cache_dir)
+                extracted = executor.map(extract_one, pdf_files, chunksize=chunksize)
+                for i, (pdf_file, data) in enumerate(zip(pdf_files, extracted)):
+                    # Report in batches; a line per file makes terminal I/O a visible cost on big runs
+                    if (i + 1) % PROGRESS_EVERY == 0 or i + 1 == len(pdf_files):
+                        print(f"Processed [{i+1}/{len(pdf_files)}] {Path(pdf_file).name}")
+                    if data:
+                        f.write(',\n' if extracted_count else '\n')
+                        f.write(json.dumps(data, separators=(',', ':')))
+                        f.flush()
+                        extracted_count += 1
+                        if keep_results:
+                            results.append(data)
+        
+        f.write('\n]\n')
     
-    print(f"\nExtracted {len(results)} bulletins")
+    print(f"\nExtracted {extracted_count} bulletins")
     print(f"Results saved to {output_json}")
     
     return results
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
     
-    if len(sys.argv) > 1:
-        directory = sys.argv[1]
-    else:
-        directory = "dataset/pdfs"
+    parser = argparse.ArgumentParser(description='Extract data from all PAGASA bulletin PDFs in a directory')
+    parser.add_argument('directory', nargs='?', default="dataset/pdfs",
+                        help='Directory searched recursively for PDFs (default: dataset/pdfs)')
+    parser.add_argument('--output', default="bin/extracted_typhoon_data.json",
+                        help='JSON file to save results (default: bin/extracted_typhoon_data.json)')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help='Cache results per PDF content in DIR (e.g. bin/extraction_cache), '
+                             'so re-runs only parse new or changed bulletins')
+    args = parser.parse_args()
     
-    extract_from_directory(directory)
+    # The records are only needed in the output file here
+    extract_from_directory(args.directory, args.output, cache_dir=args.cache_dir, keep_results=False)
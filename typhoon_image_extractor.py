@@ -15,15 +15,19 @@ right side of the table containing typhoon location, intensity, and movement dat
 """
 
 import io
-import requests
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, Tuple, Union
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import pdfplumber
 from PIL import Image
+from http_session import SESSION
 
 
+# CSS classes that mark the typhoon track image inside a tcwb-{n} tab panel
+TRACK_IMAGE_CLASSES = frozenset({'image-preview', 'img-responsive'})
+
 class TyphoonImageExtractor:
     """Extract typhoon track images from HTML pages or PDF files"""
     
@@ -51,8 +55,8 @@ class TyphoonImageExtractor:
         """
         # Load HTML content
         try:
-            if source.startswith('http://') or source.startswith('https://'):
-                response = requests.get(source, timeout=30)
+            if source.startswith(('http://', 'https://')):
+                response = SESSION.get(source, timeout=30)
                 response.raise_for_status()
                 html_content = response.text
                 base_url = source
@@ -81,12 +85,17 @@ class TyphoonImageExtractor:
             return None
         
         # Find the image within this tab panel
-        # Look for img tag with class containing 'image-preview' or 'img-responsive'
-        img_tag = tab_panel.find('img', class_=lambda x: x and ('image-preview' in x or 'img-responsive' in x))
+        # Look for img tag with class 'image-preview' or 'img-responsive', checked
+        # against bs4's pre-tokenized class list instead of a per-node callable
+        images = tab_panel.find_all('img')
+        img_tag = next(
+            (img for img in images if not TRACK_IMAGE_CLASSES.isdisjoint(img.get('class') or ())),
+            None
+        )
         
-        if not img_tag:
-            # Fallback: find any img tag in the tab panel
-            img_tag = tab_panel.find('img')
+        if not img_tag and images:
+            # Fallback: use the first img tag in the tab panel
+            img_tag = images[0]
         
         if not img_tag or not img_tag.get('src'):
             print(f"Error: No image found in tab panel '{tab_id}'")
@@ -114,9 +123,9 @@ class TyphoonImageExtractor:
         else:
             img_url = img_src
         
-        # Download the image
+        # Download the image over the shared session so the page connection is reused
         try:
-            response = requests.get(img_url, timeout=30)
+            response = SESSION.get(img_url, timeout=30)
             response.raise_for_status()
             return io.BytesIO(response.content)
         except Exception as e:
@@ -126,7 +135,8 @@ class TyphoonImageExtractor:
     def extract_image_from_pdf(
         self, 
         pdf_path: str,
-        page_number: int = 0
+        page_number: int = 0,
+        pdf=None
     ) -> Optional[io.BytesIO]:
         """
         Extract typhoon track image from PDF by cropping the region adjacent to
@@ -140,17 +150,27 @@ class TyphoonImageExtractor:
         Args:
             pdf_path: Path to PDF file
             page_number: Page number to extract from (default: 0 for first page)
+            pdf: Optional already-open pdfplumber document to reuse (left open)
             
         Returns:
             BytesIO stream containing image data, or None if extraction fails
         """
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                if page_number >= len(pdf.pages):
+            if pdf is not None:
+                # Reuse the caller's open document (and its parsed pages)
+                opener = nullcontext(pdf)
+                page_index = page_number
+            else:
+                # Only load the requested page (pdfplumber's page filter is 1-indexed)
+                opener = pdfplumber.open(pdf_path, pages=[page_number + 1])
+                page_index = 0
+            
+            with opener as pdf:
+                if len(pdf.pages) <= page_index:
                     print(f"Error: Page {page_number} not found in PDF")
                     return None
                 
-                page = pdf.pages[page_number]
+                page = pdf.pages[page_index]
                 
                 # Strategy: Find the Location/Intensity/Movement text section
                 # and crop the adjacent right-side area to capture the track map
@@ -182,7 +202,7 @@ class TyphoonImageExtractor:
                         if word['text'] == 'TRACK':
                             # Check if this is part of the forecast heading
                             nearby_words = [w for w in words if abs(w['top'] - word['top']) < 5]
-                            nearby_text = ' '.join([w['text'] for w in sorted(nearby_words, key=lambda x: x['x0'])])
+                            nearby_text = ' '.join(w['text'] for w in sorted(nearby_words, key=lambda x: x['x0']))
                             if 'INTENSITY' in nearby_text and 'FORECAST' in nearby_text:
                                 forecast_heading_y = word['top']
                                 break
@@ -378,7 +398,7 @@ class TyphoonImageExtractor:
         # Determine source type
         is_pdf = False
         
-        if source.startswith('http://') or source.startswith('https://'):
+        if source.startswith(('http://', 'https://')):
             # Check if URL points to PDF
             if source.lower().endswith('.pdf'):
                 is_pdf = True